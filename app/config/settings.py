@@ -21,6 +21,10 @@ class Settings(BaseSettings):
     email_password: str
     smtp_server: str
     smtp_port: int
+    # Parallel SMTP sessions used to send morning briefings; keep within the provider's limits
+    briefing_email_concurrency: int = 4
+    # Patient batches initialized concurrently by the daily goal job
+    goal_init_concurrency: int = 4
     
     class Config:
         env_file = ".env"
@@ -6,6 +6,8 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from app.services.patient_service import PatientService
 from app.services.health_summary_service import health_summary_service
+from app.services.email_service import stop_mail_worker
+import asyncio
 import logging
 
 # Configure logging
@@ -60,8 +62,8 @@ async def health_check():
 async def test_database():
     try:
         from app.config.database import supabase
-        # Simple test query
-        result = supabase.table("users").select("count", count="exact").execute()
+        # Simple test query (one id, no exact count: the probe only needs a round-trip)
+        supabase.table("users").select("id").limit(1).execute()
         return {"database": "connected", "message": "Supabase connection successful"}
     except Exception as e:
         return {"database": "error", "message": str(e)}
@@ -195,10 +197,17 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """
-    Gracefully shutdown the scheduler when the app stops
+    Gracefully shutdown the scheduler and mail worker when the app stops
     """
     try:
         scheduler.shutdown()
         logger.info("Scheduler shutdown successfully")
     except Exception as e:
-        logger.error(f"Error shutting down scheduler: {str(e)}")
\ No newline at end of file
+        logger.error(f"Error shutting down scheduler: {str(e)}")
+
+    # Deliver queued email before exiting instead of dropping it with the daemon thread
+    try:
+        await asyncio.to_thread(stop_mail_worker)
+        logger.info("Mail worker stopped")
+    except Exception as e:
+        logger.error(f"Error stopping mail worker: {str(e)}")
\ No newline at end of file
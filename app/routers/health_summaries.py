@@ -6,11 +6,19 @@ from app.schemas.health_summary import (
     SummaryType
 )
 from typing import Dict, List, Any, Optional
-from datetime import date
+from datetime import date, datetime, timezone
 
 router = APIRouter(prefix="/health-summaries", tags=["health-summaries"])
 
 
+def _validate_date_range(start_date: date, end_date: date) -> None:
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="start_date must be on or before end_date"
+        )
+
+
 # ==================== PATIENT ENDPOINTS ====================
 
 @router.get("/today", response_model=Optional[DailyHealthSummaryResponse])
@@ -22,14 +30,52 @@ async def get_todays_summary(
     Get today's health summary for current patient
 
     Returns most recent summary (morning briefing or evening summary)
+    """
+    try:
+        user_id = current_user["db_user"]["id"]
+        today = datetime.now(timezone.utc).date()
+
+        return await health_summary_service.get_user_summary(
+            user_id, today, summary_type.value if summary_type else None
+        )
 
-    TODO: Implement this endpoint
-    - Get user_id from current_user
-    - Get today's date
-    - Call health_summary_service.get_user_summary(user_id, today, summary_type)
-    - Return summary or null if not generated yet
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get today's summary: {str(e)}"
+        )
+
+
+# Declared before /{summary_date} so "range" isn't parsed as a date
+@router.get("/range", response_model=List[DailyHealthSummaryResponse])
+async def get_summaries_in_range(
+    start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
+    end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
+    summary_type: Optional[SummaryType] = Query(None, description="Filter by summary type"),
+    current_user: Dict = Depends(get_current_patient)
+):
     """
-    pass
+    Get health summaries for a date range
+
+    Useful for viewing summary history over weeks/months
+    """
+    try:
+        _validate_date_range(start_date, end_date)
+        user_id = current_user["db_user"]["id"]
+
+        return await health_summary_service.get_user_summaries_range(
+            user_id, start_date, end_date, summary_type.value if summary_type else None
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get summaries: {str(e)}"
+        )
 
 
 @router.get("/{summary_date}", response_model=Optional[DailyHealthSummaryResponse])
@@ -44,34 +90,21 @@ async def get_summary_by_date(
     Args:
         summary_date: Date in YYYY-MM-DD format
         summary_type: Optional filter (morning_briefing or evening_summary)
-
-    TODO: Implement this endpoint
-    - Get user_id from current_user
-    - Call health_summary_service.get_user_summary(user_id, summary_date, summary_type)
-    - Return summary or null if doesn't exist
     """
-    pass
+    try:
+        user_id = current_user["db_user"]["id"]
 
+        return await health_summary_service.get_user_summary(
+            user_id, summary_date, summary_type.value if summary_type else None
+        )
 
-@router.get("/range", response_model=List[DailyHealthSummaryResponse])
-async def get_summaries_in_range(
-    start_date: date = Query(..., description="Start date (YYYY-MM-DD)"),
-    end_date: date = Query(..., description="End date (YYYY-MM-DD)"),
-    summary_type: Optional[SummaryType] = Query(None, description="Filter by summary type"),
-    current_user: Dict = Depends(get_current_patient)
-):
-    """
-    Get health summaries for a date range
-
-    Useful for viewing summary history over weeks/months
-
-    TODO: Implement this endpoint
-    - Get user_id from current_user
-    - Validate start_date <= end_date
-    - Call health_summary_service.get_user_summaries_range()
-    - Return list of summaries ordered by date DESC
-    """
-    pass
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get summary: {str(e)}"
+        )
 
 
 @router.post("/{summary_date}/regenerate", response_model=DailyHealthSummaryResponse)
@@ -87,13 +120,19 @@ async def regenerate_summary(
     - Biomarker data was corrected/updated
     - Summary generation failed
     - Testing/debugging
-
-    TODO: Implement this endpoint
-    - Get user_id from current_user
-    - Call health_summary_service.regenerate_summary(user_id, summary_date, summary_type)
-    - Return newly generated summary
     """
-    pass
+    try:
+        user_id = current_user["db_user"]["id"]
+
+        return await health_summary_service.regenerate_summary(user_id, summary_date, summary_type.value)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to regenerate summary: {str(e)}"
+        )
 
 
 # ==================== PROVIDER ENDPOINTS ====================
@@ -108,56 +147,78 @@ async def get_patient_todays_summary(
     Provider gets today's health summary for a connected patient
 
     Business Rule: Provider must have accepted connection with patient
-
-    TODO: Implement this endpoint
-    - Get provider_user_id from current_user
-    - Verify provider has accepted connection with patient
-    - Get today's date
-    - Call health_summary_service.get_user_summary(patient_user_id, today, summary_type)
-    - Return summary
     """
-    pass
+    try:
+        provider_user_id = current_user["db_user"]["id"]
+        today = datetime.now(timezone.utc).date()
 
+        return await health_summary_service.get_patient_summary_for_provider(
+            provider_user_id, patient_user_id, today, summary_type.value if summary_type else None
+        )
 
-@router.get("/patient/{patient_user_id}/{summary_date}", response_model=Optional[DailyHealthSummaryResponse])
-async def get_patient_summary_by_date(
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get patient's summary: {str(e)}"
+        )
+
+
+@router.get("/patient/{patient_user_id}/range", response_model=List[DailyHealthSummaryResponse])
+async def get_patient_summaries_in_range(
     patient_user_id: str,
-    summary_date: date,
+    start_date: date = Query(...),
+    end_date: date = Query(...),
     summary_type: Optional[SummaryType] = Query(None),
     current_user: Dict = Depends(get_current_provider)
 ):
     """
-    Provider gets health summary for a connected patient on specific date
+    Provider gets health summaries for a connected patient over a date range
 
     Business Rule: Provider must have accepted connection with patient
-
-    TODO: Implement this endpoint
-    - Get provider_user_id from current_user
-    - Verify provider has accepted connection with patient
-    - Call health_summary_service.get_user_summary(patient_user_id, summary_date, summary_type)
-    - Return summary
     """
-    pass
+    try:
+        _validate_date_range(start_date, end_date)
+        provider_user_id = current_user["db_user"]["id"]
 
+        return await health_summary_service.get_patient_summaries_range_for_provider(
+            provider_user_id, patient_user_id, start_date, end_date,
+            summary_type.value if summary_type else None
+        )
 
-@router.get("/patient/{patient_user_id}/range", response_model=List[DailyHealthSummaryResponse])
-async def get_patient_summaries_in_range(
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get patient's summaries: {str(e)}"
+        )
+
+
+@router.get("/patient/{patient_user_id}/{summary_date}", response_model=Optional[DailyHealthSummaryResponse])
+async def get_patient_summary_by_date(
     patient_user_id: str,
-    start_date: date = Query(...),
-    end_date: date = Query(...),
+    summary_date: date,
     summary_type: Optional[SummaryType] = Query(None),
     current_user: Dict = Depends(get_current_provider)
 ):
     """
-    Provider gets health summaries for a connected patient over a date range
+    Provider gets health summary for a connected patient on specific date
 
     Business Rule: Provider must have accepted connection with patient
-
-    TODO: Implement this endpoint
-    - Get provider_user_id from current_user
-    - Verify provider has accepted connection with patient
-    - Validate date range
-    - Call health_summary_service.get_user_summaries_range(patient_user_id, start_date, end_date, summary_type)
-    - Return list of summaries
     """
-    pass
+    try:
+        provider_user_id = current_user["db_user"]["id"]
+
+        return await health_summary_service.get_patient_summary_for_provider(
+            provider_user_id, patient_user_id, summary_date, summary_type.value if summary_type else None
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get patient's summary: {str(e)}"
+        )
@@ -1,16 +1,85 @@
 from app.config.database import supabase_admin
 from app.services.email_service import email_service
+from app.services.health_summary_service import health_summary_service
+from app.utils.queries import select_in
 from fastapi import HTTPException, status
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime, timezone
+from collections import OrderedDict
 import logging
 
 logger = logging.getLogger(__name__)
 
+# user_id -> patients.id / providers.id mappings kept by _get_profile_id
+PROFILE_ID_CACHE_SIZE = 4096
+
 
 class ConnectionService:
     """Service layer for patient-provider connection management"""
 
+    # (profile table, user_id) -> profile id, least recently used first
+    _profile_ids: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+    @staticmethod
+    def _get_profile_id(table: str, user_id: str, not_found_detail: str) -> str:
+        """
+        Resolve a user's patients/providers row id
+
+        A profile's id never changes once created, so resolved ids are cached
+        (up to PROFILE_ID_CACHE_SIZE) and repeat requests skip the lookup.
+        Missing profiles are not cached.
+
+        Args:
+            table: 'patients' or 'providers'
+            user_id: The user's ID
+            not_found_detail: Error detail if the user has no profile
+
+        Returns:
+            The profile row's id
+
+        Raises:
+            HTTPException: 404 if the user has no profile in table
+        """
+        key = (table, user_id)
+        cache = ConnectionService._profile_ids
+
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        result = supabase_admin.table(table).select("id").eq("user_id", user_id).execute()
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=not_found_detail
+            )
+
+        cache[key] = result.data[0]["id"]
+        while len(cache) > PROFILE_ID_CACHE_SIZE:
+            cache.popitem(last=False)
+
+        return cache[key]
+
+    @staticmethod
+    def _select_by_ids(table: str, columns: str, ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch rows by primary key with batched .in_() queries
+
+        Used to enrich connection lists with one query per table instead of
+        one per connection.
+
+        Args:
+            table: Table to read
+            columns: Columns to select (must include id)
+            ids: Ids to look up; duplicates are ignored
+
+        Returns:
+            Dictionary of id -> row for the ids that exist
+        """
+        rows = select_in(lambda: supabase_admin.table(table).select(columns), "id", ids)
+        return {row["id"]: row for row in rows}
+
     @staticmethod
     async def request_connection(patient_user_id: str, provider_user_id: str) -> Dict:
         """
@@ -27,17 +96,7 @@ class ConnectionService:
         """
         try:
             # Get patient's database ID
-            patient_result = supabase_admin.table("patients").select("id").eq(
-                "user_id", patient_user_id
-            ).execute()
-
-            if not patient_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Patient profile not found"
-                )
-
-            patient_id = patient_result.data[0]["id"]
+            patient_id = ConnectionService._get_profile_id("patients", patient_user_id, "Patient profile not found")
 
             # Get provider's database ID and verify they're approved
             provider_result = supabase_admin.table("providers").select(
@@ -187,17 +246,7 @@ class ConnectionService:
         """
         try:
             # Get patient's database ID
-            patient_result = supabase_admin.table("patients").select("id").eq(
-                "user_id", patient_user_id
-            ).execute()
-
-            if not patient_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Patient profile not found"
-                )
-
-            patient_id = patient_result.data[0]["id"]
+            patient_id = ConnectionService._get_profile_id("patients", patient_user_id, "Patient profile not found")
 
             # Get connections
             query = supabase_admin.table("patient_provider_connections").select(
@@ -212,26 +261,25 @@ class ConnectionService:
             if not result.data:
                 return []
 
-            # Enrich with provider details
+            # Enrich with provider details, looked up for all connections at once
+            providers = ConnectionService._select_by_ids(
+                "providers",
+                "id, user_id, full_name, specialisation, years_of_experience, license_status, health_restrictions",
+                [connection["provider_id"] for connection in result.data]
+            )
+            users = ConnectionService._select_by_ids(
+                "users", "id, email", [provider["user_id"] for provider in providers.values()]
+            )
+
             enriched_connections = []
             for connection in result.data:
-                provider_id = connection["provider_id"]
-
-                # Get provider details
-                provider_result = supabase_admin.table("providers").select(
-                    "user_id, full_name, specialisation, years_of_experience, license_status, health_restrictions"
-                ).eq("id", provider_id).execute()
+                provider = providers.get(connection["provider_id"])
 
-                if provider_result.data:
-                    provider = provider_result.data[0]
-
-                    # Get provider email
-                    user_result = supabase_admin.table("users").select("email").eq(
-                        "id", provider["user_id"]
-                    ).execute()
+                if provider:
+                    user = users.get(provider["user_id"])
 
                     connection["provider_name"] = provider["full_name"]
-                    connection["provider_email"] = user_result.data[0]["email"] if user_result.data else None
+                    connection["provider_email"] = user["email"] if user else None
                     connection["provider_specialisation"] = provider.get("specialisation")
                     connection["provider_experience"] = provider.get("years_of_experience")
                     connection["provider_license_status"] = provider.get("license_status")
@@ -266,17 +314,7 @@ class ConnectionService:
         """
         try:
             # Get provider's database ID
-            provider_result = supabase_admin.table("providers").select("id").eq(
-                "user_id", provider_user_id
-            ).execute()
-
-            if not provider_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Provider profile not found"
-                )
-
-            provider_id = provider_result.data[0]["id"]
+            provider_id = ConnectionService._get_profile_id("providers", provider_user_id, "Provider profile not found")
 
             # Get connection requests
             query = supabase_admin.table("patient_provider_connections").select(
@@ -291,23 +329,22 @@ class ConnectionService:
             if not result.data:
                 return []
 
-            # Enrich with patient details
+            # Enrich with patient details, looked up for all requests at once
+            patients = ConnectionService._select_by_ids(
+                "patients",
+                "id, user_id, full_name, date_of_birth, health_goals, health_restrictions",
+                [connection["patient_id"] for connection in result.data]
+            )
+            users = ConnectionService._select_by_ids(
+                "users", "id, email", [patient["user_id"] for patient in patients.values()]
+            )
+
             enriched_requests = []
             for connection in result.data:
-                patient_id = connection["patient_id"]
-
-                # Get patient details
-                patient_result = supabase_admin.table("patients").select(
-                    "user_id, full_name, date_of_birth, health_goals, health_restrictions"
-                ).eq("id", patient_id).execute()
-
-                if patient_result.data:
-                    patient = patient_result.data[0]
+                patient = patients.get(connection["patient_id"])
 
-                    # Get patient email
-                    user_result = supabase_admin.table("users").select("email").eq(
-                        "id", patient["user_id"]
-                    ).execute()
+                if patient:
+                    user = users.get(patient["user_id"])
 
                     # Calculate age from date_of_birth
                     age = None
@@ -320,7 +357,7 @@ class ConnectionService:
                         age = today.year - dob.year - ((today.month, today.day) < (dob.month, dob.day))
 
                     connection["patient_name"] = patient["full_name"]
-                    connection["patient_email"] = user_result.data[0]["email"] if user_result.data else None
+                    connection["patient_email"] = user["email"] if user else None
                     connection["patient_age"] = age
                     connection["patient_health_goals"] = patient.get("health_goals", [])
                     connection["patient_health_restrictions"] = patient.get("health_restrictions", "").split(",") if patient.get("health_restrictions") else []
@@ -353,17 +390,7 @@ class ConnectionService:
         """
         try:
             # Get provider's database ID
-            provider_result = supabase_admin.table("providers").select("id").eq(
-                "user_id", provider_user_id
-            ).execute()
-
-            if not provider_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Provider profile not found"
-                )
-
-            provider_id = provider_result.data[0]["id"]
+            provider_id = ConnectionService._get_profile_id("providers", provider_user_id, "Provider profile not found")
 
             # Get the connection and verify it belongs to this provider
             connection_result = supabase_admin.table("patient_provider_connections").select(
@@ -473,17 +500,7 @@ class ConnectionService:
         """
         try:
             # Get provider's database ID
-            provider_result = supabase_admin.table("providers").select("id").eq(
-                "user_id", provider_user_id
-            ).execute()
-
-            if not provider_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Provider profile not found"
-                )
-
-            provider_id = provider_result.data[0]["id"]
+            provider_id = ConnectionService._get_profile_id("providers", provider_user_id, "Provider profile not found")
 
             # Get the connection and verify it belongs to this provider
             connection_result = supabase_admin.table("patient_provider_connections").select(
@@ -582,17 +599,7 @@ class ConnectionService:
         """
         try:
             # Get patient's database ID
-            patient_result = supabase_admin.table("patients").select("id").eq(
-                "user_id", patient_user_id
-            ).execute()
-
-            if not patient_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Patient profile not found"
-                )
-
-            patient_id = patient_result.data[0]["id"]
+            patient_id = ConnectionService._get_profile_id("patients", patient_user_id, "Patient profile not found")
 
             # Get the connection and verify it belongs to this patient
             connection_result = supabase_admin.table("patient_provider_connections").select(
@@ -636,6 +643,9 @@ class ConnectionService:
                     detail="Failed to disconnect"
                 )
 
+            # The provider must lose access to the patient's summaries immediately
+            health_summary_service.forget_patient_connections(patient_user_id)
+
             # Send email notification to provider
             try:
                 # Get provider user_id from provider_id
@@ -690,17 +700,7 @@ class ConnectionService:
         """
         try:
             # Get provider's database ID
-            provider_result = supabase_admin.table("providers").select("id").eq(
-                "user_id", provider_user_id
-            ).execute()
-
-            if not provider_result.data:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Provider profile not found"
-                )
-
-            provider_id = provider_result.data[0]["id"]
+            provider_id = ConnectionService._get_profile_id("providers", provider_user_id, "Provider profile not found")
 
             # Get accepted connections only
             connections = supabase_admin.table("patient_provider_connections").select(
@@ -712,23 +712,22 @@ class ConnectionService:
             if not connections.data:
                 return []
 
-            # Enrich with patient details
+            # Enrich with patient details, looked up for all connections at once
+            patients = ConnectionService._select_by_ids(
+                "patients",
+                "id, user_id, full_name, date_of_birth, health_goals, health_restrictions",
+                [connection["patient_id"] for connection in connections.data]
+            )
+            users = ConnectionService._select_by_ids(
+                "users", "id, email", [patient["user_id"] for patient in patients.values()]
+            )
+
             connected_patients = []
             for connection in connections.data:
-                patient_id = connection["patient_id"]
+                patient = patients.get(connection["patient_id"])
 
-                # Get patient details
-                patient_result = supabase_admin.table("patients").select(
-                    "user_id, full_name, date_of_birth, health_goals, health_restrictions"
-                ).eq("id", patient_id).execute()
-
-                if patient_result.data:
-                    patient = patient_result.data[0]
-
-                    # Get patient email
-                    user_result = supabase_admin.table("users").select("email").eq(
-                        "id", patient["user_id"]
-                    ).execute()
+                if patient:
+                    user = users.get(patient["user_id"])
 
                     # Calculate age
                     age = None
@@ -744,7 +743,7 @@ class ConnectionService:
                         "connection_id": connection["id"],
                         "patient_id": patient["user_id"],
                         "patient_name": patient["full_name"],
-                        "patient_email": user_result.data[0]["email"] if user_result.data else None,
+                        "patient_email": user["email"] if user else None,
                         "patient_age": age,
                         "health_goals": patient.get("health_goals", []),
                         "health_restrictions": patient.get("health_restrictions", "").split(",") if patient.get("health_restrictions") else [],
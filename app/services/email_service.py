@@ -1,12 +1,370 @@
+import hashlib
 import smtplib
+import socket
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from app.config.settings import settings
-from typing import Optional
+from app.schemas.biomarker import BiomarkerType
+from app.schemas.health_summary import OverallHealthStatus
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+EMAIL_TEMPLATES_DIR = Path(__file__).resolve().parent.parent / "templates" / "email"
+
+# Bound how long a hung SMTP server can block a send attempt
+SMTP_TIMEOUT_SECONDS = 30
+
+# Transient connection failures worth retrying; auth/recipient errors are not
+RETRYABLE_SMTP_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    socket.timeout,
+    ConnectionResetError,
+)
+
+# Queue priorities: transactional notifications are delivered ahead of bulk briefings
+PRIORITY_NOTIFICATION = 0
+PRIORITY_BRIEFING = 1
+# Sorts after all mail, so the worker's stop signal is handled once the queue is drained
+PRIORITY_STOP = 2
+
+# How many morning briefings are rendered ahead of the one being sent
+BRIEFING_RENDER_AHEAD = 16
+
+smtp_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=wait_exponential_jitter(initial=1, max=30),
+    retry=retry_if_exception_type(RETRYABLE_SMTP_ERRORS),
+    reraise=True
+)
+
+
+def _open_smtp() -> smtplib.SMTP:
+    """Open an authenticated SMTP connection"""
+    server = smtplib.SMTP(settings.smtp_server, settings.smtp_port, timeout=SMTP_TIMEOUT_SECONDS)
+    try:
+        server.ehlo()
+        server.starttls()
+        # Re-issue EHLO so extensions advertised over TLS are picked up
+        server.ehlo()
+        server.login(settings.email_sender, settings.email_password)
+    except Exception:
+        server.close()
+        raise
+
+    return server
+
+
+def _close_smtp(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from an already-dead socket"""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+class SmtpConnectionPool:
+    """
+    Thread-safe pool of authenticated SMTP connections
+
+    Connections are reused across sends and retired after MAX_MESSAGES_PER_CONNECTION
+    messages or MAX_CONNECTION_AGE_SECONDS, so most sends skip the TCP connect,
+    STARTTLS handshake and AUTH exchange.
+    """
+
+    MAX_MESSAGES_PER_CONNECTION = 100
+    MAX_CONNECTION_AGE_SECONDS = 90
+    KEEPALIVE_IDLE_SECONDS = 30
+
+    def __init__(self, size: int = 5):
+        # Idle connections as (smtp, created_at, msg_count, last_used) tuples
+        self._idle: queue.Queue = queue.Queue(maxsize=size)
+
+    @contextmanager
+    def acquire(self) -> Iterator[smtplib.SMTP]:
+        """
+        Check out a connection for the duration of the block
+
+        Connections that fail with a transient connection error are discarded
+        instead of being returned to the pool.
+        """
+        server, created_at, msg_count = self._checkout()
+        try:
+            yield server
+        except RETRYABLE_SMTP_ERRORS:
+            _close_smtp(server)
+            raise
+        except Exception:
+            self._put_back(server, created_at, msg_count)
+            raise
+        else:
+            self._put_back(server, created_at, msg_count + 1)
+
+    def _checkout(self) -> Tuple[smtplib.SMTP, float, int]:
+        """Take an idle connection, verifying long-idle ones with NOOP, or open a new one"""
+        while True:
+            try:
+                server, created_at, msg_count, last_used = self._idle.get_nowait()
+            except queue.Empty:
+                return _open_smtp(), time.monotonic(), 0
+
+            if time.monotonic() - last_used > self.KEEPALIVE_IDLE_SECONDS:
+                try:
+                    server.noop()
+                except Exception:
+                    _close_smtp(server)
+                    continue
+
+            return server, created_at, msg_count
+
+    def _put_back(self, server: smtplib.SMTP, created_at: float, msg_count: int) -> None:
+        """Return a connection to the pool unless it is due for retirement"""
+        now = time.monotonic()
+        if msg_count >= self.MAX_MESSAGES_PER_CONNECTION or now - created_at > self.MAX_CONNECTION_AGE_SECONDS:
+            _close_smtp(server)
+            return
+
+        try:
+            self._idle.put_nowait((server, created_at, msg_count, now))
+        except queue.Full:
+            _close_smtp(server)
+
+
+smtp_pool = SmtpConnectionPool()
+
+
+@smtp_retry
+def _deliver(msg: Union[MIMEMultipart, MIMEText]) -> None:
+    """Deliver a message over a pooled SMTP connection"""
+    with smtp_pool.acquire() as server:
+        server.send_message(msg)
+
+
+class SmtpBulkSession:
+    """
+    One SMTP connection held open for a batch of sends
+
+    The connection is rotated every MAX_MESSAGES_PER_CONNECTION messages and
+    reopened after a transient failure.
+    """
+
+    MAX_MESSAGES_PER_CONNECTION = 1000
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._msg_count = 0
+
+    def __enter__(self) -> "SmtpBulkSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._close()
+
+    @smtp_retry
+    def send(self, msg: Union[MIMEMultipart, MIMEText]) -> None:
+        """Deliver a message over the session's connection"""
+        if self._server is not None and self._msg_count >= self.MAX_MESSAGES_PER_CONNECTION:
+            self._close()
+
+        if self._server is None:
+            self._server = _open_smtp()
+
+        try:
+            self._server.send_message(msg)
+            self._msg_count += 1
+        except RETRYABLE_SMTP_ERRORS:
+            self._close()
+            raise
+
+    def _close(self) -> None:
+        if self._server is not None:
+            _close_smtp(self._server)
+            self._server = None
+            self._msg_count = 0
+
+
+class MailWorker(threading.Thread):
+    """
+    Background thread that delivers queued email
+
+    API code enqueues (to_email, subject, body_text, body_html, dedup_key) tuples and returns
+    immediately; the worker builds and delivers messages in small batches over pooled
+    connections, so the TCP connect + STARTTLS + login cost is paid once per connection
+    instead of per email. The queue is ordered by priority so bulk briefings can't
+    starve transactional mail. Suitable for a single API replica - move to a shared
+    task queue for multi-replica scale.
+    """
+
+    QUEUE_SIZE = 10_000
+    BATCH_SIZE = 50
+    BATCH_WAIT_SECONDS = 0.1
+    DRAIN_TIMEOUT_SECONDS = 30
+
+    def __init__(self):
+        super().__init__(name="mail-worker", daemon=True)
+        self.q: queue.PriorityQueue = queue.PriorityQueue(maxsize=self.QUEUE_SIZE)
+        self._seq = itertools.count()
+
+    def submit(self, item: tuple, priority: int = PRIORITY_NOTIFICATION) -> None:
+        """
+        Enqueue an email without blocking
+
+        Raises:
+            queue.Full: If the queue is at capacity
+        """
+        # The sequence number keeps FIFO order within a priority
+        self.q.put_nowait((priority, next(self._seq), item))
+
+    def stop(self, timeout: float = DRAIN_TIMEOUT_SECONDS) -> None:
+        """
+        Deliver everything already queued, then stop the thread
+
+        Args:
+            timeout: Seconds to wait for the queue to drain
+        """
+        self.q.put((PRIORITY_STOP, next(self._seq), None), timeout=timeout)
+        self.join(timeout)
+
+        if self.is_alive():
+            logger.warning(f"Mail worker still delivering after {timeout}s; {self.q.qsize()} emails left queued")
+
+    def run(self):
+        while True:
+            batch = [self.q.get()]
+
+            # Pick up anything else that arrives within the batch window
+            try:
+                while len(batch) < self.BATCH_SIZE and batch[-1][2] is not None:
+                    batch.append(self.q.get(timeout=self.BATCH_WAIT_SECONDS))
+            except queue.Empty:
+                pass
+
+            for _, _, item in batch:
+                if item is None:
+                    return
+
+                to_email, subject, body_text, body_html, dedup_key = item
+                try:
+                    _deliver(EmailService._build_message(to_email, subject, body_text, body_html))
+                    logger.info(f"Email sent successfully to {to_email}")
+                except Exception as e:
+                    # Let a retry of this email through the dedup check
+                    sent_emails.release(dedup_key)
+                    logger.error(f"Failed to send email to {to_email}: {str(e)}")
+
+
+_worker: Optional[MailWorker] = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker() -> MailWorker:
+    """Start the mail worker on first use"""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = MailWorker()
+            _worker.start()
+        return _worker
+
+
+def stop_mail_worker() -> None:
+    """Drain and stop the mail worker, if it was started (called on app shutdown)"""
+    global _worker
+    with _worker_lock:
+        worker, _worker = _worker, None
+
+    if worker is not None and worker.is_alive():
+        worker.stop()
+
+
+class SentEmailRegistry:
+    """
+    Short-lived record of recently dispatched emails, used to drop duplicates
+
+    A connection action retried by the client, or a job that runs twice, would
+    otherwise pay a full SMTP round-trip and show the user the same email twice.
+    Each send is keyed by recipient, subject, a digest of the body and a time
+    bucket, so identical emails within DEDUP_BUCKET_SECONDS collapse to one. The
+    registry is per-process, matching the in-process mail worker.
+    """
+
+    DEDUP_BUCKET_SECONDS = 300
+    KEY_TTL_SECONDS = 3600
+
+    def __init__(self):
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def key_for(cls, to_email: str, subject: str, body_text: str) -> str:
+        body_digest = hashlib.blake2b(body_text.encode(), digest_size=16).hexdigest()
+        bucket = int(time.time() // cls.DEDUP_BUCKET_SECONDS)
+        raw = f"{to_email}\x00{subject}\x00{body_digest}\x00{bucket}"
+        return hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+    def claim(self, key: str) -> bool:
+        """Record a send; returns False if the same email was already dispatched"""
+        now = time.monotonic()
+        with self._lock:
+            if self._expires_at.get(key, 0) > now:
+                return False
+
+            if len(self._expires_at) > 10_000:
+                self._expires_at = {k: t for k, t in self._expires_at.items() if t > now}
+
+            self._expires_at[key] = now + self.KEY_TTL_SECONDS
+            return True
+
+    def release(self, key: str) -> None:
+        """Forget a send that failed so a retry is not dropped as a duplicate"""
+        with self._lock:
+            self._expires_at.pop(key, None)
+
+
+sent_emails = SentEmailRegistry()
+
+
+# Display labels for the fixed biomarker/status vocabularies, computed once at import
+PRETTY_NAMES: Dict[str, str] = {
+    key: key.replace('_', ' ').title()
+    for key in [b.value for b in BiomarkerType] + [s.value for s in OverallHealthStatus]
+}
+
+
+def capitalize_words(value: str) -> str:
+    """Turn a snake_case key into a display label (e.g. heart_rate -> Heart Rate)"""
+    return PRETTY_NAMES.get(value) or value.replace('_', ' ').title()
+
+
+# Templates are compiled once and cached for the life of the process; HTML
+# templates autoescape user-supplied values such as names
+template_env = Environment(
+    loader=FileSystemLoader(EMAIL_TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+template_env.filters["capitalize_words"] = capitalize_words
+
+
+def render_email_template(template_name: str, **context) -> str:
+    """Render a cached email template from app/templates/email"""
+    return template_env.get_template(template_name).render(**context)
+
 
 class EmailService:
     """Service for sending email notifications"""
@@ -16,49 +374,84 @@ class EmailService:
         to_email: str,
         subject: str,
         body_text: str,
-        body_html: Optional[str] = None
+        body_html: Optional[str] = None,
+        priority: int = PRIORITY_NOTIFICATION,
+        sync: bool = False
     ) -> bool:
         """
-        Send an email using SMTP
+        Queue an email for delivery by the background mail worker
 
         Args:
             to_email: Recipient email address
             subject: Email subject
             body_text: Plain text email body
             body_html: Optional HTML email body
+            priority: PRIORITY_NOTIFICATION or PRIORITY_BRIEFING
+            sync: Send immediately on the calling thread instead of queueing (e.g. for tests)
 
         Returns:
-            True if email sent successfully, False otherwise
+            True if email was queued (or sent, when sync) successfully or an identical
+            email was already dispatched in the dedup window, False otherwise
         """
+        dedup_key = SentEmailRegistry.key_for(to_email, subject, body_text)
+        if not sent_emails.claim(dedup_key):
+            logger.info(f"Skipping duplicate email to {to_email}: {subject}")
+            return True
+
+        if sync:
+            try:
+                _deliver(EmailService._build_message(to_email, subject, body_text, body_html))
+                logger.info(f"Email sent successfully to {to_email}")
+                return True
+            except Exception as e:
+                sent_emails.release(dedup_key)
+                logger.error(f"Failed to send email to {to_email}: {str(e)}")
+                return False
+
         try:
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['Subject'] = subject
-            msg['From'] = settings.email_sender
-            msg['To'] = to_email
-
-            # Attach plain text version
-            part1 = MIMEText(body_text, 'plain')
-            msg.attach(part1)
-
-            # Attach HTML version if provided
-            if body_html:
-                part2 = MIMEText(body_html, 'html')
-                msg.attach(part2)
-
-            # Send email
-            with smtplib.SMTP(settings.smtp_server, settings.smtp_port) as server:
-                server.starttls()
-                server.login(settings.email_sender, settings.email_password)
-                server.sendmail(settings.email_sender, to_email, msg.as_string())
-
-            logger.info(f"Email sent successfully to {to_email}")
+            _get_worker().submit((to_email, subject, body_text, body_html, dedup_key), priority)
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to send email to {to_email}: {str(e)}")
+        except queue.Full:
+            sent_emails.release(dedup_key)
+            logger.error(f"Failed to queue email to {to_email}: mail queue is full")
             return False
 
+    @staticmethod
+    def _build_message(
+        to_email: str,
+        subject: str,
+        body_text: str,
+        body_html: Optional[str] = None
+    ) -> Union[MIMEMultipart, MIMEText]:
+        """
+        Build the MIME message for an email
+
+        Text-only emails are sent as a single text/plain part rather than a
+        one-part multipart envelope.
+
+        Args:
+            to_email: Recipient email address
+            subject: Email subject
+            body_text: Plain text email body
+            body_html: Optional HTML email body
+
+        Returns:
+            MIME message ready to serialize
+        """
+        if body_html:
+            msg = MIMEMultipart('alternative')
+            msg.attach(MIMEText(body_text, 'plain'))
+            msg.attach(MIMEText(body_html, 'html'))
+        else:
+            msg = MIMEText(body_text, 'plain')
+
+        msg['Subject'] = subject
+        msg['From'] = settings.email_sender
+        msg['To'] = to_email
+
+        return msg
+
     @staticmethod
     def send_connection_request_notification(
         provider_email: str,
@@ -75,29 +468,8 @@ class EmailService:
         """
         subject = "New Connection Request - Pulse"
 
-        body_text = f"""
-Hello Dr. {provider_name},
-
-You have received a new connection request from {patient_name}.
-
-Please log in to your Pulse dashboard to review and respond to this request.
-
-Best regards,
-The Pulse Team
-"""
-
-        body_html = f"""
-<html>
-  <body>
-    <h2>New Connection Request</h2>
-    <p>Hello Dr. {provider_name},</p>
-    <p>You have received a new connection request from <strong>{patient_name}</strong>.</p>
-    <p>Please log in to your Pulse dashboard to review and respond to this request.</p>
-    <br>
-    <p>Best regards,<br>The Pulse Team</p>
-  </body>
-</html>
-"""
+        body_text = render_email_template("connection_request.txt", provider_name=provider_name, patient_name=patient_name)
+        body_html = render_email_template("connection_request.html", provider_name=provider_name, patient_name=patient_name)
 
         return EmailService.send_email(provider_email, subject, body_text, body_html)
 
@@ -117,32 +489,8 @@ The Pulse Team
         """
         subject = "Connection Request Accepted - Pulse"
 
-        body_text = f"""
-Hello {patient_name},
-
-Great news! Dr. {provider_name} has accepted your connection request.
-
-You can now access personalized care and track your health goals with your healthcare provider.
-
-Log in to your Pulse dashboard to get started.
-
-Best regards,
-The Pulse Team
-"""
-
-        body_html = f"""
-<html>
-  <body>
-    <h2>Connection Request Accepted</h2>
-    <p>Hello {patient_name},</p>
-    <p>Great news! <strong>Dr. {provider_name}</strong> has accepted your connection request.</p>
-    <p>You can now access personalized care and track your health goals with your healthcare provider.</p>
-    <p>Log in to your Pulse dashboard to get started.</p>
-    <br>
-    <p>Best regards,<br>The Pulse Team</p>
-  </body>
-</html>
-"""
+        body_text = render_email_template("connection_accepted.txt", provider_name=provider_name, patient_name=patient_name)
+        body_html = render_email_template("connection_accepted.html", provider_name=provider_name, patient_name=patient_name)
 
         return EmailService.send_email(patient_email, subject, body_text, body_html)
 
@@ -162,32 +510,8 @@ The Pulse Team
         """
         subject = "Connection Request Update - Pulse"
 
-        body_text = f"""
-Hello {patient_name},
-
-We're writing to inform you that Dr. {provider_name} is currently unable to accept new patients.
-
-We encourage you to explore other healthcare providers in our directory who may be available to help you with your health journey.
-
-Log in to your Pulse dashboard to browse available providers.
-
-Best regards,
-The Pulse Team
-"""
-
-        body_html = f"""
-<html>
-  <body>
-    <h2>Connection Request Update</h2>
-    <p>Hello {patient_name},</p>
-    <p>We're writing to inform you that <strong>Dr. {provider_name}</strong> is currently unable to accept new patients.</p>
-    <p>We encourage you to explore other healthcare providers in our directory who may be available to help you with your health journey.</p>
-    <p>Log in to your Pulse dashboard to browse available providers.</p>
-    <br>
-    <p>Best regards,<br>The Pulse Team</p>
-  </body>
-</html>
-"""
+        body_text = render_email_template("connection_rejected.txt", provider_name=provider_name, patient_name=patient_name)
+        body_html = render_email_template("connection_rejected.html", provider_name=provider_name, patient_name=patient_name)
 
         return EmailService.send_email(patient_email, subject, body_text, body_html)
 
@@ -207,29 +531,8 @@ The Pulse Team
         """
         subject = "Patient Disconnected - Pulse"
 
-        body_text = f"""
-Hello Dr. {provider_name},
-
-{patient_name} has disconnected from your care.
-
-You will no longer have access to their health information in your dashboard.
-
-Best regards,
-The Pulse Team
-"""
-
-        body_html = f"""
-<html>
-  <body>
-    <h2>Patient Disconnected</h2>
-    <p>Hello Dr. {provider_name},</p>
-    <p><strong>{patient_name}</strong> has disconnected from your care.</p>
-    <p>You will no longer have access to their health information in your dashboard.</p>
-    <br>
-    <p>Best regards,<br>The Pulse Team</p>
-  </body>
-</html>
-"""
+        body_text = render_email_template("disconnection.txt", provider_name=provider_name, patient_name=patient_name)
+        body_html = render_email_template("disconnection.html", provider_name=provider_name, patient_name=patient_name)
 
         return EmailService.send_email(provider_email, subject, body_text, body_html)
 
@@ -257,149 +560,137 @@ The Pulse Team
         - Alerts (concerning values that need attention)
         - Link to view full summary in app
 
-        TODO: Implement this function
-        - Extract metrics from summary_data
-        - Format metrics for email display (with emojis/colors for status)
-        - Build HTML email template with proper styling
-        - Call send_email() with formatted subject and body
-        - Return True/False based on send success
+        Returns:
+            True if email was queued successfully, False otherwise
+        """
+        subject, body_text, body_html = EmailService._render_morning_briefing(patient_name, summary_data)
+
+        return EmailService.send_email(
+            patient_email, subject, body_text, body_html, priority=PRIORITY_BRIEFING
+        )
+
+    @staticmethod
+    def send_morning_briefings(briefings: List[Tuple[str, str, dict]]) -> List[bool]:
+        """
+        Send a batch of morning briefings over a single SMTP session
+
+        Used by the nightly job: one connection (rotated every
+        SmtpBulkSession.MAX_MESSAGES_PER_CONNECTION messages) replaces a TLS
+        handshake and login per recipient. Briefings are rendered on a helper
+        thread, overlapping template work with SMTP round-trips. Blocks until
+        the batch is delivered.
+
+        Args:
+            briefings: List of (patient_email, patient_name, summary_data) tuples
+
+        Returns:
+            Delivery result for each briefing, in input order
+        """
+        results = []
+        pending = deque()
+        briefings = iter(briefings)
+
+        def render_ahead() -> None:
+            for patient_email, patient_name, summary_data in itertools.islice(
+                briefings, BRIEFING_RENDER_AHEAD - len(pending)
+            ):
+                pending.append((
+                    patient_email,
+                    render_pool.submit(EmailService._render_morning_briefing, patient_name, summary_data)
+                ))
+
+        # Rendering runs on the render pool while this thread waits on SMTP, so
+        # the next few briefings are ready by the time the current one is sent
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="briefing-render") as render_pool:
+            with SmtpBulkSession() as session:
+                render_ahead()
+                while pending:
+                    patient_email, rendered = pending.popleft()
+                    render_ahead()
+
+                    dedup_key = None
+                    try:
+                        subject, body_text, body_html = rendered.result()
+
+                        dedup_key = SentEmailRegistry.key_for(patient_email, subject, body_text)
+                        if not sent_emails.claim(dedup_key):
+                            logger.info(f"Skipping duplicate morning briefing to {patient_email}")
+                            results.append(True)
+                            continue
+
+                        session.send(EmailService._build_message(patient_email, subject, body_text, body_html))
+                        results.append(True)
+                    except Exception as e:
+                        if dedup_key:
+                            sent_emails.release(dedup_key)
+                        logger.error(f"Failed to send morning briefing to {patient_email}: {str(e)}")
+                        results.append(False)
+
+        logger.info(f"Sent {sum(results)}/{len(results)} morning briefings")
+        return results
+
+    @staticmethod
+    def _render_morning_briefing(patient_name: str, summary_data: dict) -> Tuple[str, str, str]:
+        """
+        Render the morning briefing subject, text body and HTML body
+
+        Args:
+            patient_name: Patient's full name
+            summary_data: Health summary data (from daily_health_summaries.summary_data JSONB)
+
+        Returns:
+            Tuple of (subject, body_text, body_html)
         """
         subject = f"Your Daily Health Briefing - {summary_data.get('date', 'Today')}"
 
-        # TODO: Extract and format metrics from summary_data
-        # Example structure:
-        # metrics = summary_data.get('metrics', {})
-        # heart_rate = metrics.get('heart_rate', {})
-        # insights = summary_data.get('insights', [])
-        # alerts = summary_data.get('alerts', [])
-
-        body_text = f"""
-Good morning {patient_name},
-
-Here's your health summary for yesterday.
-
-[TODO: Format metrics, insights, and alerts in plain text]
-
-View your full health dashboard at: https://pulse-so.vercel.app/dashboard
-
-Best regards,
-The Pulse Team
-"""
-
-        body_html = f"""
-<html>
-  <head>
-    <style>
-      body {{
-        font-family: Arial, sans-serif;
-        line-height: 1.6;
-        color: #333;
-      }}
-      .container {{
-        max-width: 600px;
-        margin: 0 auto;
-        padding: 20px;
-      }}
-      .header {{
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 30px;
-        text-align: center;
-        border-radius: 10px 10px 0 0;
-      }}
-      .content {{
-        background: #ffffff;
-        padding: 30px;
-        border: 1px solid #e0e0e0;
-      }}
-      .metric-card {{
-        background: #f9f9f9;
-        padding: 15px;
-        margin: 10px 0;
-        border-radius: 8px;
-        border-left: 4px solid #667eea;
-      }}
-      .status-good {{
-        color: #28a745;
-        font-weight: bold;
-      }}
-      .status-alert {{
-        color: #dc3545;
-        font-weight: bold;
-      }}
-      .insight {{
-        background: #e8f4f8;
-        padding: 10px;
-        margin: 5px 0;
-        border-radius: 5px;
-      }}
-      .alert-box {{
-        background: #fff3cd;
-        border: 1px solid #ffc107;
-        padding: 15px;
-        margin: 15px 0;
-        border-radius: 5px;
-      }}
-      .cta-button {{
-        display: inline-block;
-        background: #667eea;
-        color: white;
-        padding: 12px 24px;
-        text-decoration: none;
-        border-radius: 5px;
-        margin: 20px 0;
-      }}
-    </style>
-  </head>
-  <body>
-    <div class="container">
-      <div class="header">
-        <h1>🌅 Good Morning, {patient_name}!</h1>
-        <p>Your Daily Health Briefing</p>
-      </div>
-      <div class="content">
-        <p><strong>Summary for:</strong> {summary_data.get('date', 'Yesterday')}</p>
-
-        <!-- TODO: Add formatted metrics cards here -->
-        <!-- Example:
-        <div class="metric-card">
-          <h3>❤️ Heart Rate</h3>
-          <p>Average: <span class="status-good">72 bpm</span></p>
-          <p>Status: Optimal Range</p>
-        </div>
-        -->
-
-        <!-- TODO: Add insights section -->
-        <!-- Example:
-        <h3>✨ Insights</h3>
-        <div class="insight">
-          Your heart rate was in optimal range throughout the day
-        </div>
-        -->
-
-        <!-- TODO: Add alerts section if any -->
-        <!-- Example:
-        <div class="alert-box">
-          <h3>⚠️ Attention Needed</h3>
-          <p>Your blood glucose was elevated in the evening</p>
-        </div>
-        -->
-
-        <a href="https://pulse-so.vercel.app/dashboard" class="cta-button">
-          View Full Dashboard
-        </a>
-
-        <p style="margin-top: 30px; color: #666; font-size: 14px;">
-          Best regards,<br>
-          The Pulse Team
-        </p>
-      </div>
-    </div>
-  </body>
-</html>
-"""
+        # Format each metric once and reuse the rows for both bodies
+        rows = [
+            (capitalize_words(k), EmailService._format_metric_value(k, v))
+            for k, v in summary_data.get('metrics', {}).items()
+        ]
 
-        return EmailService.send_email(patient_email, subject, body_text, body_html)
+        context = {
+            "patient_name": patient_name,
+            "summary_date": summary_data.get('date', 'Yesterday'),
+            "overall_status": summary_data.get('overall_status') or 'unknown',
+            "rows": rows,
+            "insights": summary_data.get('insights', []),
+            "alerts": summary_data.get('alerts', []),
+        }
+
+        body_text = render_email_template("morning_briefing.txt", **context)
+        body_html = render_email_template("morning_briefing.html", **context)
+
+        return subject, body_text, body_html
+
+    @staticmethod
+    def _format_metric_value(metric_name: str, metric_data) -> str:
+        """
+        Format a single summary metric for display in an email
+
+        Args:
+            metric_name: Metric key from summary_data.metrics (e.g. heart_rate)
+            metric_data: Metric summary dict (avg/min/max/readings_count/status)
+
+        Returns:
+            Human-readable metric value
+        """
+        if not isinstance(metric_data, dict):
+            return str(metric_data)
+
+        if metric_data.get('avg') is not None:
+            value = f"avg {metric_data['avg']}"
+            if metric_data.get('min') is not None and metric_data.get('max') is not None:
+                value += f" (min {metric_data['min']}, max {metric_data['max']})"
+        elif metric_data.get('total') is not None:
+            value = f"{metric_data['total']}"
+        elif metric_data.get('hours') is not None:
+            value = f"{metric_data['hours']} hours"
+        else:
+            value = "no data"
+
+        status = metric_data.get('status')
+        return f"{value} - {status}" if status else value
 
 
 # Create singleton instance
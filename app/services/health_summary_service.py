@@ -1,15 +1,189 @@
 from app.config.database import supabase_admin
+from app.config.settings import settings
+from app.services.email_service import email_service
+from app.schemas.biomarker import BiomarkerType
+from app.utils.queries import PAGE_SIZE, in_filter_batches, select_all, select_in
 from fastapi import HTTPException, status
-from typing import Dict, Optional, List
+from typing import AsyncIterator, Dict, Optional, List, Tuple
 from datetime import datetime, timezone, date, timedelta
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+import asyncio
+import itertools
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Keyset arguments of the per-biomarker stats functions -> row column they resume after
+BIOMARKER_STATS_KEYSET = {"p_after_user_id": "user_id", "p_after_type": "biomarker_type"}
+
+# Briefings sent per SMTP session task by send_morning_briefing_emails
+BRIEFING_EMAIL_CHUNK_SIZE = 100
+
+# Unique key of daily_health_summaries, used as the upsert conflict target
+SUMMARY_CONFLICT_KEY = "user_id,summary_date,summary_type"
+
+# daily_health_summaries columns returned to API clients (DailyHealthSummaryResponse)
+SUMMARY_COLUMNS = (
+    "id, user_id, summary_date, summary_type, summary_data, total_readings, biomarkers_tracked, "
+    "has_critical_values, has_concerning_values, overall_status, email_sent, email_sent_at, "
+    "created_at, updated_at"
+)
+
+# Rows per INSERT request when saving generated summaries
+SUMMARY_INSERT_BATCH_SIZE = 500
+
+# Summaries per page when reading a user's history; rows carry the full summary_data
+SUMMARY_RANGE_PAGE_SIZE = 200
+
+# Biomarkers reported as a daily total rather than an average of readings
+CUMULATIVE_BIOMARKERS = {"steps", "sleep"}
+
+DAILY_GOALS = {"steps": 10000, "sleep": 8.0}
+
+CONCERNING_STATUSES = {"elevated", "low"}
+
+# In-sentence labels for the fixed biomarker vocabulary (e.g. heart_rate -> heart rate)
+BIOMARKER_LABELS: Dict[str, str] = {b.value: b.value.replace('_', ' ') for b in BiomarkerType}
+
+# Verified provider/patient pairs skip the connection check for this long
+VERIFIED_CONNECTION_TTL_SECONDS = 60
+VERIFIED_CONNECTION_CACHE_SIZE = 1024
+
+# Days before the summary date averaged as the trend baseline
+TREND_WINDOW_DAYS = 7
+
+# Relative change from the previous 7-day average still counted as stable
+STABLE_TREND_THRESHOLD = 0.05
+
+# Distinct (value, bounds) classifications kept by _classify_against_bounds
+CLASSIFICATION_CACHE_SIZE = 4096
+
+
+async def _fetch_all_rpc_pages(function: str, params: Dict, keyset: Dict[str, str]) -> List[Dict]:
+    """
+    Call a set-returning function page by page until every row is read
+
+    The rpc builder cannot order or range, so the function takes p_limit and
+    keyset arguments, applies its own ORDER BY on the keyset columns and returns
+    the rows after the given key.
+
+    Args:
+        function: Name of the Postgres function
+        params: Function arguments, without p_limit or the keyset arguments
+        keyset: Keyset argument name -> row column holding its value
+
+    Returns:
+        All rows the function returns
+    """
+    rows = []
+    after = {}
+
+    while True:
+        page = await asyncio.to_thread(
+            supabase_admin.rpc(function, {**params, **after, "p_limit": PAGE_SIZE}).execute
+        )
+        page_rows = page.data or []
+        rows.extend(page_rows)
+
+        if len(page_rows) < PAGE_SIZE:
+            return rows
+
+        after = {argument: page_rows[-1][column] for argument, column in keyset.items()}
+
+
+def _classify_value(value: float, ranges: Optional[Dict]) -> str:
+    """
+    Classify a value against a biomarker_ranges row
+
+    Returns:
+        optimal, normal, elevated, low or critical
+    """
+    if not ranges:
+        return "normal"
+
+    return _classify_against_bounds(
+        value,
+        ranges.get("critical_low"), ranges.get("critical_high"),
+        ranges.get("min_optimal"), ranges.get("max_optimal"),
+        ranges.get("min_normal"), ranges.get("max_normal")
+    )
+
+
+@lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+def _classify_against_bounds(
+    value: float,
+    critical_low: Optional[float],
+    critical_high: Optional[float],
+    min_optimal: Optional[float],
+    max_optimal: Optional[float],
+    min_normal: Optional[float],
+    max_normal: Optional[float]
+) -> str:
+    """_classify_value() on scalar bounds, memoized since rounded values repeat across users"""
+    # A missing bound is open on that side
+    if critical_low is not None and value <= critical_low:
+        return "critical"
+    if critical_high is not None and value >= critical_high:
+        return "critical"
+
+    if (min_optimal is None or value >= min_optimal) and (max_optimal is None or value <= max_optimal):
+        return "optimal"
+
+    if (min_normal is None or value >= min_normal) and (max_normal is None or value <= max_normal):
+        return "normal"
+
+    return "elevated" if max_normal is not None and value > max_normal else "low"
+
+
+def _calculate_trend(value: float, previous: Optional[float], ranges: Optional[Dict]) -> Optional[str]:
+    """Compare a day's value with the previous 7-day average: improving, stable or declining"""
+    if previous is None:
+        return None
+
+    if previous == 0 or abs(value - previous) / abs(previous) <= STABLE_TREND_THRESHOLD:
+        return "stable"
+
+    low = ranges.get("min_optimal") if ranges else None
+    high = ranges.get("max_optimal") if ranges else None
+    if low is None and high is None:
+        return "stable"
+
+    # Distance from the optimal band; moving closer counts as improving
+    def distance(v: float) -> float:
+        if low is not None and v < low:
+            return low - v
+        if high is not None and v > high:
+            return v - high
+        return 0.0
+
+    return "improving" if distance(value) <= distance(previous) else "declining"
+
+
+def _overall_status(statuses: List[str]) -> str:
+    """Roll per-biomarker statuses up into an OverallHealthStatus value"""
+    if "critical" in statuses:
+        return "critical"
+
+    concerning = sum(1 for s in statuses if s in CONCERNING_STATUSES)
+    if concerning >= 2:
+        return "needs_attention"
+    if concerning == 1:
+        return "fair"
+
+    if statuses and all(s == "optimal" for s in statuses):
+        return "excellent"
+
+    return "good"
+
 
 class HealthSummaryService:
     """Service layer for daily health summary generation and management"""
 
+    # (provider_user_id, patient_user_id) -> expiry, oldest first
+    _verified_connections: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+
     @staticmethod
     async def generate_morning_briefing(target_date: Optional[date] = None) -> Dict:
         """
@@ -39,14 +213,11 @@ class HealthSummaryService:
             - summaries_created: Number of summaries created
             - users_with_alerts: Number of users with critical alerts
 
-        TODO: Implement this function
-        - Default target_date to yesterday if not provided
-        - Query all users with biomarker data from target_date
-        - For each user, call calculate_daily_summary()
-        - Insert summary into daily_health_summaries table
-        - Return generation statistics
         """
-        pass
+        if target_date is None:
+            target_date = datetime.now(timezone.utc).date() - timedelta(days=1)
+
+        return await HealthSummaryService._generate_summaries(target_date, "morning_briefing")
 
     @staticmethod
     async def generate_evening_summary(target_date: Optional[date] = None) -> Dict:
@@ -65,22 +236,148 @@ class HealthSummaryService:
         Returns:
             Dictionary with generation statistics
 
-        TODO: Implement this function
-        - Default target_date to today if not provided
-        - Query all users with biomarker data from target_date
-        - For each user, call calculate_daily_summary()
-        - Include daily_achievements and areas_for_improvement
-        - Insert summary into daily_health_summaries table
-        - Return generation statistics
         """
-        pass
+        if target_date is None:
+            target_date = datetime.now(timezone.utc).date()
+
+        return await HealthSummaryService._generate_summaries(target_date, "evening_summary")
+
+    @staticmethod
+    async def _generate_summaries(target_date: date, summary_type: str) -> Dict:
+        """
+        Calculate and store summaries of target_date for every user with readings that day
+
+        Stats for all users are fetched up front, so each user's summary is pure
+        computation and users are summarized in a plain loop. Summaries are collected
+        in memory and written with batched bulk INSERTs (SUMMARY_INSERT_BATCH_SIZE
+        rows per request) instead of one INSERT per user.
+
+        Args:
+            target_date: Date to summarize
+            summary_type: 'morning_briefing' or 'evening_summary'
+
+        Returns:
+            Dictionary with generation statistics
+        """
+        try:
+            stats_by_user = await HealthSummaryService._fetch_day_stats(target_date)
+            previous_by_user = await HealthSummaryService._fetch_previous_averages(target_date)
+            user_ids = list(stats_by_user.keys())
+
+            rows = []
+            users_with_alerts = 0
+            # Rows in one run share a date string and creation time
+            summary_date = target_date.isoformat()
+            created_at = datetime.now(timezone.utc).isoformat()
+
+            for user_id in user_ids:
+                try:
+                    result = await HealthSummaryService.calculate_daily_summary(
+                        user_id, target_date, summary_type,
+                        preloaded_stats=stats_by_user[user_id],
+                        preloaded_previous=previous_by_user.get(user_id, {})
+                    )
+                except Exception as e:
+                    logger.error(f"Error calculating {summary_type} for user {user_id}: {str(e)}")
+                    continue
+
+                if not result:
+                    continue
+
+                if result["has_critical_values"]:
+                    users_with_alerts += 1
+
+                rows.append({
+                    **HealthSummaryService._summary_row(user_id, summary_date, summary_type, result),
+                    "email_sent": False,
+                    "created_at": created_at
+                })
+
+            summaries_created = await asyncio.to_thread(HealthSummaryService._insert_summaries, rows)
+
+            return {
+                "total_users_processed": len(user_ids),
+                "summaries_created": summaries_created,
+                "users_with_alerts": users_with_alerts
+            }
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to generate {summary_type}: {str(e)}"
+            )
+
+    @staticmethod
+    async def _fetch_day_stats(target_date: date, user_id: Optional[str] = None) -> Dict[str, List[Dict]]:
+        """
+        Get per-biomarker reading stats for target_date, grouped by user
+
+        Aggregation runs in Postgres (daily_biomarker_summary), so one row per user
+        and biomarker is transferred rather than every reading. Each row also
+        carries the biomarker's reference range.
+
+        Args:
+            target_date: Date to aggregate
+            user_id: Optional user to restrict the stats to
+
+        Returns:
+            Dictionary of user_id -> list of {biomarker_type, readings_count, total,
+            min_value, max_value, has_range, <biomarker_ranges columns>} rows
+        """
+        params = {"p_day": target_date.isoformat(), "p_user_id": user_id}
+        rows = await _fetch_all_rpc_pages("daily_biomarker_summary", params, BIOMARKER_STATS_KEYSET)
+
+        stats_by_user: Dict[str, List[Dict]] = defaultdict(list)
+        for row in rows:
+            stats_by_user[row["user_id"]].append(row)
+
+        return stats_by_user
+
+    @staticmethod
+    def _summary_row(user_id: str, summary_date: str, summary_type: str, result: Dict) -> Dict:
+        """Build the computed columns of a daily_health_summaries row from a calculate_daily_summary() result"""
+        return {
+            "user_id": user_id,
+            "summary_date": summary_date,
+            "summary_type": summary_type,
+            "summary_data": result["summary_data"],
+            "total_readings": result["total_readings"],
+            "biomarkers_tracked": result["biomarkers_tracked"],
+            "has_critical_values": result["has_critical_values"],
+            "has_concerning_values": result["has_concerning_values"],
+            "overall_status": result["overall_status"]
+        }
+
+    @staticmethod
+    def _insert_summaries(rows: List[Dict]) -> int:
+        """
+        Bulk insert summary rows in batches of SUMMARY_INSERT_BATCH_SIZE
+
+        Rows for a (user, date, type) that already has a summary are skipped.
+
+        Returns:
+            Number of rows inserted
+        """
+        inserted = 0
+        rows_iter = iter(rows)
+
+        while batch := list(itertools.islice(rows_iter, SUMMARY_INSERT_BATCH_SIZE)):
+            # A re-run for the same day keeps the existing (possibly already emailed) summaries
+            result = supabase_admin.table("daily_health_summaries").upsert(
+                batch, on_conflict=SUMMARY_CONFLICT_KEY, ignore_duplicates=True
+            ).execute()
+            inserted += len(result.data) if result.data else 0
+
+        return inserted
 
     @staticmethod
     async def calculate_daily_summary(
         user_id: str,
         target_date: date,
-        summary_type: str
-    ) -> Dict:
+        summary_type: str,
+        preloaded_stats: Optional[List[Dict]] = None,
+        preloaded_previous: Optional[Dict[str, float]] = None
+    ) -> Optional[Dict]:
         """
         Calculate daily health summary for a single user
 
@@ -89,13 +386,15 @@ class HealthSummaryService:
 
         DATA SOURCES:
 
-        1. **biomarkers table** (main data source):
-           Query: SELECT * FROM biomarkers
+        1. **biomarkers table** (main data source), aggregated server-side by
+           the daily_biomarker_summary SQL function:
+           Query: SELECT biomarker_type, COUNT(*), SUM(value), MIN(value), MAX(value)
+                  FROM biomarkers
                   WHERE user_id = ?
                   AND DATE(recorded_at) = target_date
-                  ORDER BY biomarker_type, recorded_at
+                  GROUP BY biomarker_type
 
-           Returns all biomarker readings for the day. Group by biomarker_type to calculate:
+           Returns one stats row per biomarker type for the day, used to calculate:
            - Heart Rate: AVG(value), MIN(value), MAX(value), COUNT(*)
            - Blood Pressure Systolic: AVG(value WHERE biomarker_type = 'blood_pressure_systolic')
            - Blood Pressure Diastolic: AVG(value WHERE biomarker_type = 'blood_pressure_diastolic')
@@ -103,15 +402,16 @@ class HealthSummaryService:
            - Steps: SUM(value) - usually 1 reading per day
            - Sleep: SUM(value) - usually 1 reading per day
 
-        2. **biomarker_ranges table** (for status determination):
-           Query: SELECT * FROM biomarker_ranges WHERE biomarker_type = ?
+        2. **biomarker_ranges table** (for status determination), LEFT JOINed
+           onto each stats row by daily_biomarker_summary:
 
            Returns reference ranges to compare against:
            - min_optimal, max_optimal → status = 'optimal'
            - min_normal, max_normal → status = 'normal'
            - critical_low, critical_high → status = 'critical'
 
-        3. **Previous 7 days from biomarkers table** (for trend calculation):
+        3. **Previous 7 days from biomarkers table** (for trend calculation),
+           averaged server-side by the previous_biomarker_averages SQL function:
            Query: SELECT biomarker_type, DATE(recorded_at), AVG(value)
                   FROM biomarkers
                   WHERE user_id = ?
@@ -150,6 +450,9 @@ class HealthSummaryService:
             user_id: User's ID
             target_date: Date to calculate summary for
             summary_type: 'morning_briefing' or 'evening_summary'
+            preloaded_stats: The user's _fetch_day_stats() rows for target_date when
+                already fetched by the caller; skips the stats query
+            preloaded_previous: The user's _fetch_previous_averages() entry, likewise
 
         Returns:
             Dictionary containing:
@@ -159,17 +462,123 @@ class HealthSummaryService:
             - has_critical_values: Boolean flag
             - has_concerning_values: Boolean flag
             - overall_status: excellent/good/fair/needs_attention/critical
+            or None if the user has no readings for target_date
+        """
+        if preloaded_stats is None:
+            stats_by_user = await HealthSummaryService._fetch_day_stats(target_date, user_id)
+            preloaded_stats = stats_by_user.get(user_id, [])
+
+        if not preloaded_stats:
+            return None
+
+        if preloaded_previous is None:
+            previous_by_user = await HealthSummaryService._fetch_previous_averages(target_date, user_id)
+            preloaded_previous = previous_by_user.get(user_id, {})
+
+        metrics = {}
+        statuses = []
+        insights = []
+        alerts = []
+        daily_achievements = []
+        areas_for_improvement = []
+
+        for stats in preloaded_stats:
+            biomarker = stats["biomarker_type"]
+            count = stats["readings_count"]
+            total = float(stats["total"])
+            ranges = stats if stats.get("has_range") else None
+
+            label = BIOMARKER_LABELS.get(biomarker) or biomarker.replace('_', ' ')
+
+            if biomarker in CUMULATIVE_BIOMARKERS:
+                value = int(total) if biomarker == "steps" else round(total, 1)
+                goal = DAILY_GOALS[biomarker]
+                metric = {"hours": value} if biomarker == "sleep" else {"total": value}
+                metric.update({
+                    "goal": goal,
+                    "percentage": round(value / goal * 100, 2),
+                    "readings_count": count
+                })
+                stat_name = "total"
+            else:
+                value = round(total / count, 1)
+                metric = {
+                    "avg": value,
+                    "min": stats["min_value"],
+                    "max": stats["max_value"],
+                    "readings_count": count
+                }
+                stat_name = "average"
+
+            metric_status = _classify_value(value, ranges)
+            metric["status"] = metric_status
+            metric["trend"] = _calculate_trend(value, preloaded_previous.get(biomarker), ranges)
+            metrics[biomarker] = metric
+            statuses.append(metric_status)
+
+            if metric_status == "optimal":
+                insights.append(f"Your {stat_name} {label} was in the optimal range")
+                daily_achievements.append(f"Kept your {label} in the optimal range")
+            elif metric_status == "critical":
+                alerts.append(f"Critical: your {stat_name} {label} of {value} is outside the safe range")
+                areas_for_improvement.append(f"Bring your {label} back into the normal range")
+            elif metric_status in CONCERNING_STATUSES:
+                alerts.append(f"Your {stat_name} {label} was {metric_status}")
+                areas_for_improvement.append(f"Bring your {label} back into the normal range")
+
+            if biomarker in DAILY_GOALS and value >= DAILY_GOALS[biomarker]:
+                insights.append(f"You reached your {label} goal!")
+                daily_achievements.append(f"Reached your {label} goal")
+
+        overall_status = _overall_status(statuses)
+        is_evening = summary_type == "evening_summary"
+
+        summary_data = {
+            "date": target_date.isoformat(),
+            "summary_type": summary_type,
+            "overall_status": overall_status,
+            "metrics": metrics,
+            "insights": insights,
+            "alerts": alerts,
+            "recommendations": [],
+            "daily_achievements": daily_achievements if is_evening else [],
+            "areas_for_improvement": areas_for_improvement if is_evening else []
+        }
+
+        return {
+            "summary_data": summary_data,
+            "total_readings": sum(stats["readings_count"] for stats in preloaded_stats),
+            "biomarkers_tracked": list(metrics.keys()),
+            "has_critical_values": "critical" in statuses,
+            "has_concerning_values": any(s in CONCERNING_STATUSES for s in statuses),
+            "overall_status": overall_status
+        }
 
-        TODO: Implement this function
-        - Query biomarkers table for user_id and target_date
-        - Group by biomarker_type and calculate statistics
-        - Query biomarker_ranges for status determination
-        - Query previous 7 days from biomarkers for trend calculation
-        - Generate insights based on values and status
-        - Build summary_data JSONB structure
-        - Return complete summary dictionary
+    @staticmethod
+    async def _fetch_previous_averages(target_date: date, user_id: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Get each user's average daily value per biomarker over the TREND_WINDOW_DAYS before target_date
+
+        A day's value is the mean of its readings, or their sum for
+        CUMULATIVE_BIOMARKERS, matching how calculate_daily_summary reports them.
+        The per-day grouping runs in Postgres (previous_biomarker_averages).
+
+        Args:
+            target_date: Day the trend is measured for (excluded from the window)
+            user_id: Optional user to restrict the averages to
+
+        Returns:
+            Dictionary of user_id -> {biomarker_type: average} (only types with data)
         """
-        pass
+        params = {"p_day": target_date.isoformat(), "p_days": TREND_WINDOW_DAYS, "p_user_id": user_id}
+        rows = await _fetch_all_rpc_pages("previous_biomarker_averages", params, BIOMARKER_STATS_KEYSET)
+
+        averages: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for row in rows:
+            column = "avg_daily_total" if row["biomarker_type"] in CUMULATIVE_BIOMARKERS else "avg_daily_mean"
+            averages[row["user_id"]][row["biomarker_type"]] = row[column]
+
+        return averages
 
     @staticmethod
     async def send_morning_briefing_emails() -> int:
@@ -193,16 +602,107 @@ class HealthSummaryService:
         Returns:
             Number of emails sent
 
-        TODO: Implement this function
-        - Query daily_health_summaries where email_sent=false
-        - For each summary:
-          * Get user details (name, email)
-          * Format summary_data for email template
-          * Call email_service.send_morning_briefing()
-          * Update email_sent=true and email_sent_at
-        - Return count of emails sent
         """
-        pass
+        try:
+            summaries = await asyncio.to_thread(
+                select_all,
+                lambda: supabase_admin.table("daily_health_summaries").select(
+                    "id, user_id, summary_data"
+                ).eq("email_sent", False).eq("summary_type", "morning_briefing").order("id")
+            )
+
+            if not summaries:
+                return 0
+
+            users = await asyncio.to_thread(
+                HealthSummaryService._get_users_by_id, list({s["user_id"] for s in summaries})
+            )
+
+            # (summary_id, (email, name, summary_data)) for every summary we can address
+            deliverable = []
+            for summary in summaries:
+                user = users.get(summary["user_id"])
+                if not user or not user.get("email"):
+                    logger.warning(f"No email address for user {summary['user_id']}, skipping briefing")
+                    continue
+
+                patient_name = user.get("full_name") or user.get("username") or "there"
+                deliverable.append((summary["id"], (user["email"], patient_name, summary["summary_data"])))
+
+            # Each chunk goes out over its own SMTP session on a worker thread,
+            # with at most settings.briefing_email_concurrency sessions open
+            semaphore = asyncio.Semaphore(settings.briefing_email_concurrency)
+
+            async def send_chunk(chunk: List[tuple]) -> List[str]:
+                async with semaphore:
+                    results = await asyncio.to_thread(
+                        email_service.send_morning_briefings, [briefing for _, briefing in chunk]
+                    )
+                return [summary_id for (summary_id, _), ok in zip(chunk, results) if ok]
+
+            tasks = [
+                send_chunk(deliverable[i:i + BRIEFING_EMAIL_CHUNK_SIZE])
+                for i in range(0, len(deliverable), BRIEFING_EMAIL_CHUNK_SIZE)
+            ]
+
+            # Mark each chunk as soon as it is delivered, so a slow session doesn't
+            # hold back the others' updates (or cause resends if the job dies)
+            sent_count = 0
+            for next_chunk in asyncio.as_completed(tasks):
+                try:
+                    sent_ids = await next_chunk
+                except Exception as e:
+                    logger.error(f"Error sending morning briefing batch: {str(e)}")
+                    continue
+
+                await asyncio.to_thread(HealthSummaryService._mark_emails_sent, sent_ids)
+                sent_count += len(sent_ids)
+                logger.info(f"Morning briefings sent: {sent_count}/{len(deliverable)}")
+
+            return sent_count
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to send morning briefing emails: {str(e)}"
+            )
+
+    @staticmethod
+    def _mark_emails_sent(summary_ids: List[str]) -> None:
+        """Set email_sent/email_sent_at on summaries with batched .in_() updates"""
+        sent_at = datetime.now(timezone.utc).isoformat()
+
+        for batch in in_filter_batches(summary_ids):
+            # return=minimal: the updated rows (summary_data included) aren't needed back
+            supabase_admin.table("daily_health_summaries").update({
+                "email_sent": True,
+                "email_sent_at": sent_at
+            }, returning="minimal").in_("id", batch).execute()
+
+    @staticmethod
+    def _get_users_by_id(user_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Look up name and email for many users with batched .in_() queries
+
+        users has no full_name; it is read from the matching patients rows.
+
+        Args:
+            user_ids: Distinct user IDs
+
+        Returns:
+            Dictionary of user_id -> {id, email, username, full_name}
+        """
+        users = {
+            u["id"]: u
+            for u in select_in(lambda: supabase_admin.table("users").select("id, email, username"), "id", user_ids)
+        }
+
+        patients = select_in(lambda: supabase_admin.table("patients").select("user_id, full_name"), "user_id", user_ids)
+        for patient in patients:
+            if patient["user_id"] in users:
+                users[patient["user_id"]]["full_name"] = patient["full_name"]
+
+        return users
 
     @staticmethod
     async def get_user_summary(
@@ -221,12 +721,72 @@ class HealthSummaryService:
         Returns:
             Summary record or None if not found
 
-        TODO: Implement this function
-        - Query daily_health_summaries table
-        - Filter by user_id, summary_date, and optionally summary_type
-        - Return most recent summary if multiple exist
         """
-        pass
+        try:
+            query = supabase_admin.table("daily_health_summaries").select(SUMMARY_COLUMNS).eq(
+                "user_id", user_id
+            ).eq("summary_date", summary_date.isoformat())
+
+            if summary_type:
+                query = query.eq("summary_type", summary_type)
+
+            result = await asyncio.to_thread(query.order("created_at", desc=True).limit(1).execute)
+
+            return result.data[0] if result.data else None
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch health summary: {str(e)}"
+            )
+
+    @staticmethod
+    async def iter_user_summaries_range(
+        user_id: str,
+        start_date: date,
+        end_date: date,
+        summary_type: Optional[str] = None
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield a user's health summaries within a date range, newest first
+
+        Rows are read SUMMARY_RANGE_PAGE_SIZE at a time, so long ranges are
+        neither truncated by PostgREST's max-rows cap nor fetched in one response.
+
+        Args:
+            user_id: User's ID
+            start_date: Start of date range
+            end_date: End of date range
+            summary_type: Optional filter by type
+
+        Yields:
+            Summary records ordered by date DESC
+        """
+        offset = 0
+
+        while True:
+            query = supabase_admin.table("daily_health_summaries").select(SUMMARY_COLUMNS).eq(
+                "user_id", user_id
+            ).gte("summary_date", start_date.isoformat()).lte("summary_date", end_date.isoformat())
+
+            if summary_type:
+                query = query.eq("summary_type", summary_type)
+
+            # summary_type breaks ties within a date so pages don't overlap
+            page = await asyncio.to_thread(
+                query.order("summary_date", desc=True).order("summary_type").limit(
+                    SUMMARY_RANGE_PAGE_SIZE
+                ).offset(offset).execute
+            )
+            rows = page.data or []
+
+            for row in rows:
+                yield row
+
+            if len(rows) < SUMMARY_RANGE_PAGE_SIZE:
+                return
+
+            offset += SUMMARY_RANGE_PAGE_SIZE
 
     @staticmethod
     async def get_user_summaries_range(
@@ -249,14 +809,113 @@ class HealthSummaryService:
         Returns:
             List of summary records ordered by date DESC
 
-        TODO: Implement this function
-        - Query daily_health_summaries table
-        - Filter by user_id and date range
-        - Optionally filter by summary_type
-        - Order by summary_date DESC
-        - Return list of summaries
         """
-        pass
+        try:
+            return [
+                row async for row in HealthSummaryService.iter_user_summaries_range(
+                    user_id, start_date, end_date, summary_type
+                )
+            ]
+
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to fetch health summaries: {str(e)}"
+            )
+
+    @staticmethod
+    async def _verify_provider_patient_connection(provider_user_id: str, patient_user_id: str) -> None:
+        """
+        Ensure the provider has an accepted connection with the patient
+
+        Uses the check_provider_patient_connection SQL function, which resolves
+        both profiles and the connection in one round-trip. Successful checks
+        are remembered for VERIFIED_CONNECTION_TTL_SECONDS, since a provider
+        dashboard hits several endpoints for the same patient at once.
+
+        Raises:
+            HTTPException: 403 if there is no accepted connection
+        """
+        key = (provider_user_id, patient_user_id)
+        cache = HealthSummaryService._verified_connections
+
+        if cache.get(key, 0) > time.monotonic():
+            return
+
+        result = await asyncio.to_thread(supabase_admin.rpc("check_provider_patient_connection", {
+            "p_provider_user_id": provider_user_id,
+            "p_patient_user_id": patient_user_id
+        }).execute)
+
+        if not result.data:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You do not have an accepted connection with this patient"
+            )
+
+        cache.pop(key, None)
+        cache[key] = time.monotonic() + VERIFIED_CONNECTION_TTL_SECONDS
+        while len(cache) > VERIFIED_CONNECTION_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    @staticmethod
+    def forget_patient_connections(patient_user_id: str) -> None:
+        """Drop cached connection checks for a patient (call when a connection ends)"""
+        cache = HealthSummaryService._verified_connections
+        for key in [k for k in cache if k[1] == patient_user_id]:
+            del cache[key]
+
+    @staticmethod
+    async def get_patient_summary_for_provider(
+        provider_user_id: str,
+        patient_user_id: str,
+        summary_date: date,
+        summary_type: Optional[str] = None
+    ) -> Optional[Dict]:
+        """
+        Provider gets a connected patient's health summary for a date
+
+        Business Rule: Provider must have an accepted connection with the patient
+
+        Args:
+            provider_user_id: The provider's user ID
+            patient_user_id: The patient's user ID
+            summary_date: Date of summary
+            summary_type: Optional filter by type
+
+        Returns:
+            Summary record or None if not found
+        """
+        await HealthSummaryService._verify_provider_patient_connection(provider_user_id, patient_user_id)
+        return await HealthSummaryService.get_user_summary(patient_user_id, summary_date, summary_type)
+
+    @staticmethod
+    async def get_patient_summaries_range_for_provider(
+        provider_user_id: str,
+        patient_user_id: str,
+        start_date: date,
+        end_date: date,
+        summary_type: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        Provider gets a connected patient's health summaries within a date range
+
+        Business Rule: Provider must have an accepted connection with the patient
+
+        Args:
+            provider_user_id: The provider's user ID
+            patient_user_id: The patient's user ID
+            start_date: Start of date range
+            end_date: End of date range
+            summary_type: Optional filter by type
+
+        Returns:
+            List of summary records ordered by date DESC
+        """
+        await HealthSummaryService._verify_provider_patient_connection(provider_user_id, patient_user_id)
+        return await HealthSummaryService.get_user_summaries_range(
+            patient_user_id, start_date, end_date, summary_type
+        )
 
     @staticmethod
     async def regenerate_summary(
@@ -279,14 +938,38 @@ class HealthSummaryService:
 
         Returns:
             Updated summary record
-
-        TODO: Implement this function
-        - Delete existing summary if exists (user_id, target_date, summary_type)
-        - Call calculate_daily_summary()
-        - Insert new summary
-        - Return new summary record
         """
-        pass
+        try:
+            result = await HealthSummaryService.calculate_daily_summary(user_id, target_date, summary_type)
+            if not result:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="No biomarker readings found for this date"
+                )
+
+            # Replace the stored summary in place, leaving its email status and creation time alone
+            row = HealthSummaryService._summary_row(user_id, target_date.isoformat(), summary_type, result)
+            row["updated_at"] = datetime.now(timezone.utc).isoformat()
+
+            upsert_result = await asyncio.to_thread(supabase_admin.table("daily_health_summaries").upsert(
+                row, on_conflict=SUMMARY_CONFLICT_KEY
+            ).execute)
+
+            if not upsert_result.data:
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to save regenerated summary"
+                )
+
+            return upsert_result.data[0]
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to regenerate summary: {str(e)}"
+            )
 
 
 # Create singleton instance
@@ -1,26 +1,46 @@
 from app.config.database import supabase_admin
+from app.config.settings import settings
+from app.utils.queries import select_all
 from fastapi import HTTPException, status
 from typing import Dict, Optional, List
 from datetime import datetime, timezone, date, timedelta
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Unique key of goal_completions, used as the upsert conflict target
+GOAL_COMPLETION_CONFLICT_KEY = "user_id,goal_text,completion_date"
+
+# goal_completions columns returned to API clients (GoalCompletionResponse)
+GOAL_COMPLETION_COLUMNS = (
+    "id, user_id, goal_text, goal_frequency, completion_date, status, completed_at, created_at, updated_at"
+)
+
+# Patients per batch when initializing everyone's daily goals; also bounds
+# the ids in each goal_completions .in_() filter
+GOAL_INIT_BATCH_SIZE = 200
 
 
 class PatientService:
     """Service layer for patient-related business logic"""
 
     @staticmethod
-    async def get_patient_profile(user_id: str) -> Optional[Dict]:
+    async def get_patient_profile(user_id: str, columns: str = "*") -> Optional[Dict]:
         """
         Get patient profile data
         Uses admin client to bypass RLS
 
         Args:
             user_id: The user's ID
+            columns: Columns to select; internal callers that need a few fields
+                narrow this to skip large JSONB columns
 
         Returns:
             Patient profile data or None if not found
         """
         try:
-            result = supabase_admin.table("patients").select("*").eq(
+            result = supabase_admin.table("patients").select(columns).eq(
                 "user_id", user_id
             ).execute()
 
@@ -208,28 +228,14 @@ class PatientService:
             Goal completion record
         """
         try:
-            # Check if record already exists
-            existing = supabase_admin.table("goal_completions").select("*").eq(
-                "user_id", user_id
-            ).eq("goal_text", goal_text).eq("completion_date", completion_date).execute()
-
-            if existing.data:
-                # Update existing record
-                result = supabase_admin.table("goal_completions").update({
-                    "status": "completed",
-                    "completed_at": datetime.now(timezone.utc).isoformat(),
-                    "updated_at": datetime.now(timezone.utc).isoformat()
-                }).eq("id", existing.data[0]["id"]).execute()
-            else:
-                # Create new record
-                result = supabase_admin.table("goal_completions").insert({
-                    "user_id": user_id,
-                    "goal_text": goal_text,
-                    "goal_frequency": goal_frequency,
-                    "completion_date": completion_date,
-                    "status": "completed",
-                    "completed_at": datetime.now(timezone.utc).isoformat()
-                }).execute()
+            # Insert or complete the existing record for this goal and day in one request;
+            # goal_frequency only applies to a new record
+            result = supabase_admin.rpc("complete_goal", {
+                "p_user_id": user_id,
+                "p_goal_text": goal_text,
+                "p_goal_frequency": goal_frequency,
+                "p_completion_date": completion_date
+            }).execute()
 
             return result.data[0] if result.data else {}
 
@@ -287,7 +293,7 @@ class PatientService:
             if not start_date:
                 start_date = (date.today() - timedelta(days=365)).isoformat()
 
-            result = supabase_admin.table("goal_completions").select("*").eq(
+            result = supabase_admin.table("goal_completions").select(GOAL_COMPLETION_COLUMNS).eq(
                 "user_id", user_id
             ).gte("completion_date", start_date).lte("completion_date", end_date).order(
                 "completion_date", desc=True
@@ -313,68 +319,24 @@ class PatientService:
             Statistics including completion rate, current streak, etc.
         """
         try:
-            # Get all completions
-            all_completions = supabase_admin.table("goal_completions").select("*").eq(
-                "user_id", user_id
-            ).order("completion_date", desc=False).execute()
-
-            completions = all_completions.data or []
-
-            # Calculate stats
-            total_tracked = len(completions)
-            total_completed = len([c for c in completions if c["status"] == "completed"])
-            total_missed = len([c for c in completions if c["status"] == "missed"])
+            # Counts and streaks are computed in Postgres (goal_stats), one row back
+            result = supabase_admin.rpc("goal_stats", {
+                "p_user_id": user_id,
+                "p_today": date.today().isoformat()
+            }).execute()
+
+            stats = result.data[0] if result.data else {}
+            total_tracked = stats.get("total_tracked") or 0
+            total_completed = stats.get("total_completed") or 0
+            total_missed = stats.get("total_missed") or 0
+            current_streak = stats.get("current_streak") or 0
+            longest_streak = stats.get("longest_streak") or 0
 
             # Calculate completion rate (completed / total tracked goals)
             completion_rate = 0.0
             if total_tracked > 0:
                 completion_rate = round((total_completed / total_tracked) * 100, 1)
 
-            # Calculate current streak (consecutive days with all goals completed)
-            current_streak = 0
-            if completions:
-                # Group by date
-                from collections import defaultdict
-                by_date = defaultdict(list)
-                for c in completions:
-                    by_date[c["completion_date"]].append(c)
-
-                # Check consecutive days from today backwards
-                check_date = date.today()
-                while True:
-                    date_str = check_date.isoformat()
-                    if date_str not in by_date:
-                        break
-
-                    day_goals = by_date[date_str]
-                    # All goals for this day must be completed
-                    if all(g["status"] == "completed" for g in day_goals):
-                        current_streak += 1
-                        check_date -= timedelta(days=1)
-                    else:
-                        break
-
-            # Calculate longest streak
-            longest_streak = 0
-            if completions:
-                temp_streak = 0
-                last_date = None
-
-                for comp_date in sorted(set(c["completion_date"] for c in completions)):
-                    day_goals = [c for c in completions if c["completion_date"] == comp_date]
-
-                    if all(g["status"] == "completed" for g in day_goals):
-                        if last_date and (datetime.fromisoformat(comp_date).date() - datetime.fromisoformat(last_date).date()).days == 1:
-                            temp_streak += 1
-                        else:
-                            temp_streak = 1
-
-                        longest_streak = max(longest_streak, temp_streak)
-                        last_date = comp_date
-                    else:
-                        temp_streak = 0
-                        last_date = None
-
             return {
                 "total_tracked": total_tracked,
                 "total_completed": total_completed,
@@ -403,46 +365,70 @@ class PatientService:
         """
         try:
             # Get user's health goals
-            profile = await PatientService.get_patient_profile(user_id)
+            profile = await PatientService.get_patient_profile(user_id, columns="user_id, health_goals")
             if not profile or not profile.get("health_goals"):
                 return []
 
-            health_goals = profile["health_goals"]
-            today = date.today().isoformat()
-            created_records = []
+            return PatientService._create_pending_goals([profile], date.today().isoformat())
 
-            for goal_obj in health_goals:
-                goal_text = goal_obj.get("goal", "")
-                goal_frequency = goal_obj.get("frequency", "daily")
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to initialize daily goals: {str(e)}"
+            )
 
-                if not goal_text:
-                    continue
+    @staticmethod
+    def _create_pending_goals(patients: List[Dict], completion_date: str) -> List[Dict]:
+        """
+        Create pending goal completions for patients' goals that have none on completion_date
 
-                # Check if already exists for today
-                existing = supabase_admin.table("goal_completions").select("*").eq(
-                    "user_id", user_id
-                ).eq("goal_text", goal_text).eq("completion_date", today).execute()
+        Reads the patients' existing records for the date with one (paged) .in_()
+        query and writes everything missing with one bulk upsert. Rows created
+        concurrently (e.g. by mark_goal_complete) are left as they are.
 
-                if not existing.data:
-                    # Create pending record for today
-                    result = supabase_admin.table("goal_completions").insert({
-                        "user_id": user_id,
-                        "goal_text": goal_text,
-                        "goal_frequency": goal_frequency,
-                        "completion_date": today,
-                        "status": "pending"
-                    }).execute()
+        Args:
+            patients: patients rows with user_id and health_goals (at most GOAL_INIT_BATCH_SIZE)
+            completion_date: Date to initialize (YYYY-MM-DD)
 
-                    if result.data:
-                        created_records.extend(result.data)
+        Returns:
+            List of created goal completion records
+        """
+        user_ids = [patient["user_id"] for patient in patients]
+        if not user_ids:
+            return []
+
+        existing = select_all(
+            lambda: supabase_admin.table("goal_completions").select("user_id, goal_text").in_(
+                "user_id", user_ids
+            ).eq("completion_date", completion_date).order("id")
+        )
+        tracked = {(row["user_id"], row["goal_text"]) for row in existing}
+
+        rows = []
+        for patient in patients:
+            for goal_obj in patient.get("health_goals") or []:
+                goal_text = goal_obj.get("goal", "")
+                key = (patient["user_id"], goal_text)
 
-            return created_records
+                if not goal_text or key in tracked:
+                    continue
 
-        except Exception as e:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=f"Failed to initialize daily goals: {str(e)}"
-            )
+                tracked.add(key)
+                rows.append({
+                    "user_id": patient["user_id"],
+                    "goal_text": goal_text,
+                    "goal_frequency": goal_obj.get("frequency", "daily"),
+                    "completion_date": completion_date,
+                    "status": "pending"
+                })
+
+        if not rows:
+            return []
+
+        result = supabase_admin.table("goal_completions").upsert(
+            rows, on_conflict=GOAL_COMPLETION_CONFLICT_KEY, ignore_duplicates=True
+        ).execute()
+        return result.data or []
 
     @staticmethod
     async def mark_missed_goals() -> int:
@@ -456,12 +442,10 @@ class PatientService:
         try:
             today = date.today().isoformat()
 
-            result = supabase_admin.table("goal_completions").update({
-                "status": "missed",
-                "updated_at": datetime.now(timezone.utc).isoformat()
-            }).eq("status", "pending").lt("completion_date", today).execute()
+            # The UPDATE runs in mark_missed_goals, which returns just the row count
+            result = supabase_admin.rpc("mark_missed_goals", {"p_today": today}).execute()
 
-            return len(result.data) if result.data else 0
+            return result.data or 0
 
         except Exception as e:
             raise HTTPException(
@@ -479,26 +463,45 @@ class PatientService:
             Dictionary with success count and error count
         """
         try:
-            # Get all patients with completed onboarding
-            result = supabase_admin.table("patients").select("user_id").eq(
-                "onboarding_completed", True
-            ).execute()
+            # Get all patients with completed onboarding, goals included
+            patients = select_all(
+                lambda: supabase_admin.table("patients").select("user_id, health_goals").eq(
+                    "onboarding_completed", True
+                ).order("user_id")
+            )
+            patients = [patient for patient in patients if patient.get("user_id")]
 
-            if not result.data:
+            if not patients:
                 return {"success": 0, "errors": 0, "message": "No patients found"}
 
+            today = date.today().isoformat()
+            batches = [
+                patients[i:i + GOAL_INIT_BATCH_SIZE]
+                for i in range(0, len(patients), GOAL_INIT_BATCH_SIZE)
+            ]
+
+            # One existence query and one bulk insert per batch of patients, with up
+            # to settings.goal_init_concurrency batches in flight on worker threads
+            semaphore = asyncio.Semaphore(settings.goal_init_concurrency)
+
+            async def initialize_batch(batch: List[Dict]) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(PatientService._create_pending_goals, batch, today)
+
+            results = await asyncio.gather(
+                *(initialize_batch(batch) for batch in batches),
+                return_exceptions=True
+            )
+
             success_count = 0
             error_count = 0
 
-            for patient in result.data:
-                try:
-                    user_id = patient.get("user_id")
-                    if user_id:
-                        await PatientService.initialize_daily_goals(user_id)
-                        success_count += 1
-                except Exception as e:
-                    print(f"Error initializing goals for patient {patient.get('user_id')}: {str(e)}")
-                    error_count += 1
+            for batch, result in zip(batches, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error initializing goals for {len(batch)} patients: {str(result)}")
+                    error_count += len(batch)
+                else:
+                    success_count += len(batch)
 
             return {
                 "success": success_count,
@@ -0,0 +1,68 @@
+from typing import Callable, Dict, Iterator, List, Sequence
+
+# Rows per page for reads that can exceed PostgREST's default max-rows
+PAGE_SIZE = 1000
+
+# Ids per .in_() filter, keeping request URLs well under server limits
+IN_FILTER_BATCH_SIZE = 200
+
+
+def select_all(build_query: Callable) -> List[Dict]:
+    """
+    Run a select page by page until every matching row is read
+
+    Args:
+        build_query: Callable returning a fresh select builder with a stable order
+
+    Returns:
+        All matching rows
+    """
+    rows = []
+    offset = 0
+
+    while True:
+        page = build_query().limit(PAGE_SIZE).offset(offset).execute()
+        page_rows = page.data or []
+        rows.extend(page_rows)
+
+        if len(page_rows) < PAGE_SIZE:
+            return rows
+
+        offset += PAGE_SIZE
+
+
+def in_filter_batches(values: Sequence) -> Iterator[List]:
+    """
+    Split values for .in_() filters, IN_FILTER_BATCH_SIZE at a time
+
+    Args:
+        values: Values to filter on; duplicates are dropped
+
+    Yields:
+        Lists of at most IN_FILTER_BATCH_SIZE distinct values
+    """
+    unique_values = list(dict.fromkeys(values))
+
+    for i in range(0, len(unique_values), IN_FILTER_BATCH_SIZE):
+        yield unique_values[i:i + IN_FILTER_BATCH_SIZE]
+
+
+def select_in(build_query: Callable, column: str, values: Sequence) -> List[Dict]:
+    """
+    Run a select filtered to column IN values, one request per batch of values
+
+    Args:
+        build_query: Callable returning a fresh select builder (without the .in_() filter)
+        column: Column the values are matched against
+        values: Values to look up
+
+    Returns:
+        Matching rows from every batch
+    """
+    rows = []
+
+    for batch in in_filter_batches(values):
+        result = build_query().in_(column, batch).execute()
+        rows.extend(result.data or [])
+
+    return rows
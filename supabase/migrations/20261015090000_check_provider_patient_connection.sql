@@ -0,0 +1,24 @@
+-- Resolve both profile ids and check for an accepted connection in one call,
+-- so provider-facing endpoints authorize with a single round-trip.
+create or replace function public.check_provider_patient_connection(
+    p_provider_user_id uuid,
+    p_patient_user_id uuid
+)
+returns boolean
+language sql
+stable
+as $$
+    select exists (
+        select 1
+        from public.patient_provider_connections c
+        join public.providers p on p.id = c.provider_id
+        join public.patients pa on pa.id = c.patient_id
+        where p.user_id = p_provider_user_id
+          and pa.user_id = p_patient_user_id
+          and c.status = 'accepted'
+    );
+$$;
+
+-- Only the backend's service-role client calls this; keep it off the public /rpc API
+revoke execute on function public.check_provider_patient_connection(uuid, uuid) from public, anon, authenticated;
+grant execute on function public.check_provider_patient_connection(uuid, uuid) to service_role;
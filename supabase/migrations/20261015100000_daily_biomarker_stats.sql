@@ -0,0 +1,31 @@
+-- Per-user, per-biomarker reading stats for one day, aggregated in Postgres so
+-- summary generation receives one row per (user, biomarker) instead of every reading.
+-- Pass p_user_id to restrict the result to a single user.
+create or replace function public.daily_biomarker_stats(
+    p_day date,
+    p_user_id uuid default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    readings_count bigint,
+    total double precision,
+    min_value double precision,
+    max_value double precision
+)
+language sql
+stable
+as $$
+    select
+        b.user_id,
+        b.biomarker_type::text,
+        count(*),
+        sum(b.value)::double precision,
+        min(b.value)::double precision,
+        max(b.value)::double precision
+    from public.biomarkers b
+    where b.recorded_at >= p_day
+      and b.recorded_at < p_day + 1
+      and (p_user_id is null or b.user_id = p_user_id)
+    group by b.user_id, b.biomarker_type;
+$$;
@@ -0,0 +1,57 @@
+-- Replace daily_biomarker_stats with daily_biomarker_summary, which also joins
+-- each biomarker's reference range so summary generation needs no separate
+-- biomarker_ranges lookup. has_range is false when no range is configured.
+drop function if exists public.daily_biomarker_stats(date, uuid);
+
+create or replace function public.daily_biomarker_summary(
+    p_day date,
+    p_user_id uuid default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    readings_count bigint,
+    total double precision,
+    min_value double precision,
+    max_value double precision,
+    has_range boolean,
+    min_normal double precision,
+    max_normal double precision,
+    min_optimal double precision,
+    max_optimal double precision,
+    critical_low double precision,
+    critical_high double precision
+)
+language sql
+stable
+as $$
+    select
+        s.user_id,
+        s.biomarker_type,
+        s.readings_count,
+        s.total,
+        s.min_value,
+        s.max_value,
+        r.biomarker_type is not null,
+        r.min_normal::double precision,
+        r.max_normal::double precision,
+        r.min_optimal::double precision,
+        r.max_optimal::double precision,
+        r.critical_low::double precision,
+        r.critical_high::double precision
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            count(*) as readings_count,
+            sum(b.value)::double precision as total,
+            min(b.value)::double precision as min_value,
+            max(b.value)::double precision as max_value
+        from public.biomarkers b
+        where b.recorded_at >= p_day
+          and b.recorded_at < p_day + 1
+          and (p_user_id is null or b.user_id = p_user_id)
+        group by b.user_id, b.biomarker_type
+    ) s
+    left join public.biomarker_ranges r on r.biomarker_type::text = s.biomarker_type;
+$$;
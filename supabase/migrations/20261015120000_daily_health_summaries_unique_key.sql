@@ -0,0 +1,16 @@
+-- One summary per user, date and type. Lets writers upsert on this key instead
+-- of select-then-insert/update, and stops re-run jobs from duplicating rows.
+
+-- Keep only the newest row of any existing duplicates so the index can be built.
+-- A null created_at sorts as oldest; otherwise the row comparison is null and
+-- neither duplicate would be deleted.
+delete from public.daily_health_summaries d
+using public.daily_health_summaries newer
+where d.user_id = newer.user_id
+  and d.summary_date = newer.summary_date
+  and d.summary_type = newer.summary_type
+  and (coalesce(d.created_at, '-infinity'), d.id)
+    < (coalesce(newer.created_at, '-infinity'), newer.id);
+
+create unique index if not exists daily_health_summaries_user_date_type_key
+    on public.daily_health_summaries (user_id, summary_date, summary_type);
@@ -0,0 +1,39 @@
+-- Trend baselines for summary generation: per user and biomarker, the average
+-- daily value over the p_days days before p_day. A day's value is either the
+-- mean of its readings (avg_daily_mean) or their sum (avg_daily_total); the
+-- caller picks whichever matches how the biomarker is reported.
+-- Pass p_user_id to restrict the result to a single user.
+create or replace function public.previous_biomarker_averages(
+    p_day date,
+    p_days integer default 7,
+    p_user_id uuid default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    avg_daily_mean double precision,
+    avg_daily_total double precision
+)
+language sql
+stable
+as $$
+    select
+        d.user_id,
+        d.biomarker_type,
+        avg(d.total / d.readings_count),
+        avg(d.total)
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            b.recorded_at::date as day,
+            sum(b.value)::double precision as total,
+            count(*) as readings_count
+        from public.biomarkers b
+        where b.recorded_at >= p_day - p_days
+          and b.recorded_at < p_day
+          and (p_user_id is null or b.user_id = p_user_id)
+        group by b.user_id, b.biomarker_type, b.recorded_at::date
+    ) d
+    group by d.user_id, d.biomarker_type;
+$$;
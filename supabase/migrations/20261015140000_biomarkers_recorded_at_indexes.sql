@@ -0,0 +1,14 @@
+-- Covering indexes for the summary aggregation functions:
+--   * (recorded_at, user_id) serves the all-users day scans in
+--     daily_biomarker_summary / previous_biomarker_averages
+--   * (user_id, recorded_at) serves the single-user variants and history reads
+-- INCLUDE lets both run as index-only scans without heap fetches.
+-- Migrations run inside a transaction, so CONCURRENTLY cannot be used here; on
+-- a large existing table, create these by hand with CONCURRENTLY first.
+create index if not exists ix_biomarkers_recorded_user
+    on public.biomarkers (recorded_at, user_id)
+    include (biomarker_type, value);
+
+create index if not exists ix_biomarkers_user_recorded
+    on public.biomarkers (user_id, recorded_at)
+    include (biomarker_type, value);
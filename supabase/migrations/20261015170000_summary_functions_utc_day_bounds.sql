@@ -0,0 +1,92 @@
+-- Pin the summary functions' day boundaries to UTC (the timezone the cron jobs
+-- use) instead of the session TimeZone. Bounds are computed once from the date
+-- parameter as timestamptz constants, so the recorded_at range stays an index
+-- range scan on ix_biomarkers_recorded_user / ix_biomarkers_user_recorded.
+
+create or replace function public.daily_biomarker_summary(
+    p_day date,
+    p_user_id uuid default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    readings_count bigint,
+    total double precision,
+    min_value double precision,
+    max_value double precision,
+    has_range boolean,
+    min_normal double precision,
+    max_normal double precision,
+    min_optimal double precision,
+    max_optimal double precision,
+    critical_low double precision,
+    critical_high double precision
+)
+language sql
+stable
+as $$
+    select
+        s.user_id,
+        s.biomarker_type,
+        s.readings_count,
+        s.total,
+        s.min_value,
+        s.max_value,
+        r.biomarker_type is not null,
+        r.min_normal::double precision,
+        r.max_normal::double precision,
+        r.min_optimal::double precision,
+        r.max_optimal::double precision,
+        r.critical_low::double precision,
+        r.critical_high::double precision
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            count(*) as readings_count,
+            sum(b.value)::double precision as total,
+            min(b.value)::double precision as min_value,
+            max(b.value)::double precision as max_value
+        from public.biomarkers b
+        where b.recorded_at >= (p_day::timestamp at time zone 'UTC')
+          and b.recorded_at < ((p_day + 1)::timestamp at time zone 'UTC')
+          and (p_user_id is null or b.user_id = p_user_id)
+        group by b.user_id, b.biomarker_type
+    ) s
+    left join public.biomarker_ranges r on r.biomarker_type::text = s.biomarker_type;
+$$;
+
+create or replace function public.previous_biomarker_averages(
+    p_day date,
+    p_days integer default 7,
+    p_user_id uuid default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    avg_daily_mean double precision,
+    avg_daily_total double precision
+)
+language sql
+stable
+as $$
+    select
+        d.user_id,
+        d.biomarker_type,
+        avg(d.total / d.readings_count),
+        avg(d.total)
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            (b.recorded_at at time zone 'UTC')::date as day,
+            sum(b.value)::double precision as total,
+            count(*) as readings_count
+        from public.biomarkers b
+        where b.recorded_at >= ((p_day - p_days)::timestamp at time zone 'UTC')
+          and b.recorded_at < (p_day::timestamp at time zone 'UTC')
+          and (p_user_id is null or b.user_id = p_user_id)
+        group by 1, 2, 3
+    ) d
+    group by d.user_id, d.biomarker_type;
+$$;
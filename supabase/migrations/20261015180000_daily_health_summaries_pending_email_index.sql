@@ -0,0 +1,8 @@
+-- The (user_id, recorded_at) and (user_id, summary_date, summary_type) lookups
+-- are already indexed (ix_biomarkers_user_recorded and
+-- daily_health_summaries_user_date_type_key). The remaining unindexed read is
+-- send_morning_briefing_emails' scan for unsent briefings, ordered by id. Almost
+-- every row has email_sent = true, so a partial index keeps that scan small.
+create index if not exists ix_daily_health_summaries_pending_briefings
+    on public.daily_health_summaries (id)
+    where email_sent = false and summary_type = 'morning_briefing';
@@ -0,0 +1,47 @@
+-- Goal completion statistics for one user, so get_goal_stats receives one row
+-- instead of the user's entire goal_completions history.
+-- A day counts towards a streak when every goal tracked that day was completed;
+-- streaks are runs of consecutive such days (gaps and islands over the dates).
+-- p_today anchors the current streak, which must end on that day.
+create or replace function public.goal_stats(
+    p_user_id uuid,
+    p_today date
+)
+returns table (
+    total_tracked bigint,
+    total_completed bigint,
+    total_missed bigint,
+    current_streak integer,
+    longest_streak integer
+)
+language sql
+stable
+as $$
+    with completions as (
+        select g.completion_date, g.status::text as status
+        from public.goal_completions g
+        where g.user_id = p_user_id
+    ),
+    completed_days as (
+        select c.completion_date
+        from completions c
+        group by c.completion_date
+        having bool_and(c.status = 'completed')
+    ),
+    streaks as (
+        select max(d.completion_date) as last_day, count(*)::integer as length
+        from (
+            select
+                completion_date,
+                completion_date - (row_number() over (order by completion_date))::integer as run_key
+            from completed_days
+        ) d
+        group by d.run_key
+    )
+    select
+        (select count(*) from completions),
+        (select count(*) from completions c where c.status = 'completed'),
+        (select count(*) from completions c where c.status = 'missed'),
+        coalesce((select s.length from streaks s where s.last_day = p_today), 0),
+        coalesce((select max(s.length) from streaks s), 0);
+$$;
@@ -0,0 +1,14 @@
+-- One completion record per user, goal and day. Lets mark_goal_complete upsert
+-- on this key instead of select-then-insert/update, and stops double taps from
+-- racing into duplicate rows.
+
+-- Collapse existing duplicates, keeping a completed row over any other status
+delete from public.goal_completions g
+using public.goal_completions keep
+where g.user_id = keep.user_id
+  and g.goal_text = keep.goal_text
+  and g.completion_date = keep.completion_date
+  and ((g.status = 'completed')::int, g.id) < ((keep.status = 'completed')::int, keep.id);
+
+create unique index if not exists goal_completions_user_goal_date_key
+    on public.goal_completions (user_id, goal_text, completion_date);
@@ -0,0 +1,23 @@
+-- Flip overdue pending goals to missed server-side and return only the number
+-- of rows changed, instead of sending every updated row back to the cron job.
+create or replace function public.mark_missed_goals(p_today date)
+returns integer
+language plpgsql
+as $$
+declare
+    marked integer;
+begin
+    update public.goal_completions
+    set status = 'missed',
+        updated_at = now()
+    where status = 'pending'
+      and completion_date < p_today;
+
+    get diagnostics marked = row_count;
+    return marked;
+end;
+$$;
+
+-- Only the backend's service-role client calls this; keep it off the public /rpc API
+revoke execute on function public.mark_missed_goals(date) from public, anon, authenticated;
+grant execute on function public.mark_missed_goals(date) to service_role;
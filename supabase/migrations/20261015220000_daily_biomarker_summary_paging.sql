@@ -0,0 +1,69 @@
+-- Page daily_biomarker_summary inside the function. PostgREST's rpc builder has
+-- no order/range, so the function orders by (user_id, biomarker_type) and takes
+-- a keyset: p_after_user_id / p_after_type are the last row of the previous
+-- page. Each page then only aggregates the groups it returns, where an offset
+-- would re-aggregate every earlier group. The old signature is dropped so the
+-- two-argument version does not linger as an ambiguous overload.
+
+drop function if exists public.daily_biomarker_summary(date, uuid);
+
+create or replace function public.daily_biomarker_summary(
+    p_day date,
+    p_user_id uuid default null,
+    p_limit integer default null,
+    p_after_user_id uuid default null,
+    p_after_type text default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    readings_count bigint,
+    total double precision,
+    min_value double precision,
+    max_value double precision,
+    has_range boolean,
+    min_normal double precision,
+    max_normal double precision,
+    min_optimal double precision,
+    max_optimal double precision,
+    critical_low double precision,
+    critical_high double precision
+)
+language sql
+stable
+as $$
+    select
+        s.user_id,
+        s.biomarker_type,
+        s.readings_count,
+        s.total,
+        s.min_value,
+        s.max_value,
+        r.biomarker_type is not null,
+        r.min_normal::double precision,
+        r.max_normal::double precision,
+        r.min_optimal::double precision,
+        r.max_optimal::double precision,
+        r.critical_low::double precision,
+        r.critical_high::double precision
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            count(*) as readings_count,
+            sum(b.value)::double precision as total,
+            min(b.value)::double precision as min_value,
+            max(b.value)::double precision as max_value
+        from public.biomarkers b
+        where b.recorded_at >= (p_day::timestamp at time zone 'UTC')
+          and b.recorded_at < ((p_day + 1)::timestamp at time zone 'UTC')
+          and (p_user_id is null or b.user_id = p_user_id)
+          and (p_after_user_id is null or (b.user_id, b.biomarker_type::text) > (p_after_user_id, p_after_type))
+        group by b.user_id, b.biomarker_type
+        -- By the text type, the same ordering as the keyset comparison above
+        order by 1, 2
+        limit p_limit
+    ) s
+    left join public.biomarker_ranges r on r.biomarker_type::text = s.biomarker_type
+    order by s.user_id, s.biomarker_type;
+$$;
@@ -0,0 +1,48 @@
+-- Page previous_biomarker_averages inside the function with the same keyset as
+-- daily_biomarker_summary: rows are ordered by (user_id, biomarker_type) and
+-- p_after_user_id / p_after_type are the last row of the previous page, so a
+-- page never re-aggregates the window for groups already returned. The old
+-- signature is dropped so it does not linger as an ambiguous overload.
+
+drop function if exists public.previous_biomarker_averages(date, integer, uuid);
+
+create or replace function public.previous_biomarker_averages(
+    p_day date,
+    p_days integer default 7,
+    p_user_id uuid default null,
+    p_limit integer default null,
+    p_after_user_id uuid default null,
+    p_after_type text default null
+)
+returns table (
+    user_id uuid,
+    biomarker_type text,
+    avg_daily_mean double precision,
+    avg_daily_total double precision
+)
+language sql
+stable
+as $$
+    select
+        d.user_id,
+        d.biomarker_type,
+        avg(d.total / d.readings_count),
+        avg(d.total)
+    from (
+        select
+            b.user_id,
+            b.biomarker_type::text as biomarker_type,
+            (b.recorded_at at time zone 'UTC')::date as day,
+            sum(b.value)::double precision as total,
+            count(*) as readings_count
+        from public.biomarkers b
+        where b.recorded_at >= ((p_day - p_days)::timestamp at time zone 'UTC')
+          and b.recorded_at < (p_day::timestamp at time zone 'UTC')
+          and (p_user_id is null or b.user_id = p_user_id)
+          and (p_after_user_id is null or (b.user_id, b.biomarker_type::text) > (p_after_user_id, p_after_type))
+        group by 1, 2, 3
+    ) d
+    group by d.user_id, d.biomarker_type
+    order by d.user_id, d.biomarker_type
+    limit p_limit;
+$$;
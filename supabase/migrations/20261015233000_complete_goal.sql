@@ -0,0 +1,27 @@
+-- Insert or complete a goal's record for one day in a single statement.
+-- Unlike a PostgREST upsert, the conflict branch only touches the completion
+-- columns, so an existing record keeps its goal_frequency.
+create or replace function public.complete_goal(
+    p_user_id public.goal_completions.user_id%type,
+    p_goal_text public.goal_completions.goal_text%type,
+    p_goal_frequency public.goal_completions.goal_frequency%type,
+    p_completion_date public.goal_completions.completion_date%type
+)
+returns setof public.goal_completions
+language sql
+as $$
+    insert into public.goal_completions as g
+        (user_id, goal_text, goal_frequency, completion_date, status, completed_at)
+    values
+        (p_user_id, p_goal_text, p_goal_frequency, p_completion_date, 'completed', now())
+    on conflict (user_id, goal_text, completion_date) do update
+    set status = 'completed',
+        completed_at = now(),
+        updated_at = now()
+    returning g.*;
+$$;
+
+-- Only the backend's service-role client calls this; keep it off the public /rpc API.
+-- Named without arguments (it has no overloads) since they follow the column types.
+revoke execute on function public.complete_goal from public, anon, authenticated;
+grant execute on function public.complete_goal to service_role;
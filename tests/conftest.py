@@ -0,0 +1,194 @@
+import os
+import uuid
+
+import pytest
+
+# Settings are read at import time; give the app harmless values so services import
+for _name, _value in {
+    "SUPABASE_URL": "https://test.supabase.co",
+    "SUPABASE_KEY": "eyJhbGciOiJIUzI1NiJ9.e30.test",
+    "SUPABASE_SERVICE_KEY": "eyJhbGciOiJIUzI1NiJ9.e30.test",
+    "COGNITO_USER_POOL_ID": "test",
+    "COGNITO_CLIENT_ID": "test",
+    "AWS_ACCESS_KEY_ID": "test",
+    "AWS_SECRET_ACCESS_KEY": "test",
+    "S3_BUCKET_NAME": "test",
+    "SECRET_KEY": "test",
+    "EMAIL_SENDER": "noreply@test.com",
+    "EMAIL_PASSWORD": "test",
+    "SMTP_SERVER": "localhost",
+    "SMTP_PORT": "25",
+}.items():
+    os.environ.setdefault(_name, _value)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+        self.count = None
+
+
+class FakeQuery:
+    """
+    In-memory stand-in for a postgrest-py 0.13 table request builder
+
+    Mirrors the behaviour the services depend on: range(start, end) has an
+    exclusive end, and responses are capped at MAX_ROWS like PostgREST's max-rows.
+    """
+
+    MAX_ROWS = 1000
+
+    def __init__(self, db: "FakeSupabase", table: str):
+        self.db = db
+        self.table_name = table
+        self.filters = []
+        self.ordering = []
+        self.row_limit = None
+        self.row_offset = 0
+        self.columns = "*"
+        self.operation = "select"
+        self.payload = None
+        self.on_conflict = None
+        self.ignore_duplicates = False
+
+    @property
+    def rows(self):
+        return self.db.tables.setdefault(self.table_name, [])
+
+    def select(self, *columns, count=None):
+        self.columns = ",".join(columns) or "*"
+        self.db.selects.append((self.table_name, self.columns))
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def lt(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) < str(value))
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) >= str(value))
+        return self
+
+    def lte(self, column, value):
+        self.filters.append(lambda row: str(row.get(column)) <= str(value))
+        return self
+
+    def in_(self, column, values):
+        values = list(values)
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column, desc=False):
+        self.ordering.append((column, desc))
+        return self
+
+    def limit(self, size):
+        self.row_limit = size
+        return self
+
+    def offset(self, size):
+        self.row_offset = size
+        return self
+
+    def range(self, start, end):
+        self.row_offset = start
+        self.row_limit = end - start
+        return self
+
+    def insert(self, json, **kwargs):
+        self.operation, self.payload = "insert", json
+        return self
+
+    def upsert(self, json, on_conflict=None, ignore_duplicates=False, **kwargs):
+        self.operation, self.payload = "upsert", json
+        self.on_conflict = on_conflict
+        self.ignore_duplicates = ignore_duplicates
+        return self
+
+    def update(self, json, **kwargs):
+        self.operation, self.payload = "update", json
+        return self
+
+    def execute(self):
+        self.db.calls.append((self.table_name, self.operation))
+
+        if self.operation in ("insert", "upsert"):
+            return FakeResponse(self._write())
+
+        matched = [row for row in self.rows if all(f(row) for f in self.filters)]
+
+        if self.operation == "update":
+            for row in matched:
+                row.update(self.payload)
+            return FakeResponse([dict(row) for row in matched])
+
+        for column, desc in reversed(self.ordering):
+            matched.sort(key=lambda row: str(row.get(column)), reverse=desc)
+
+        limit = min(self.row_limit or self.MAX_ROWS, self.MAX_ROWS)
+        return FakeResponse([self._project(row) for row in matched[self.row_offset:self.row_offset + limit]])
+
+    def _project(self, row):
+        """Return only the selected columns, like PostgREST (embedded selects are passed through)"""
+        if "*" in self.columns or "(" in self.columns:
+            return dict(row)
+        return {column.strip(): row.get(column.strip()) for column in self.columns.split(",")}
+
+    def _write(self):
+        payload = self.payload if isinstance(self.payload, list) else [self.payload]
+        keys = self.on_conflict.split(",") if self.on_conflict else []
+        written = []
+
+        for new_row in payload:
+            existing = next(
+                (row for row in self.rows if keys and all(row.get(k) == new_row.get(k) for k in keys)),
+                None
+            )
+            if existing is not None:
+                if self.operation == "insert":
+                    raise Exception("duplicate key value violates unique constraint")
+                if not self.ignore_duplicates:
+                    existing.update(new_row)
+                    written.append(dict(existing))
+                continue
+
+            row = {"id": str(uuid.uuid4()), **new_row}
+            self.rows.append(row)
+            written.append(dict(row))
+
+        return written
+
+
+class FakeRPC:
+    """postgrest-py 0.13 rpc() builder: only execute(), no order/range/limit"""
+
+    def __init__(self, db: "FakeSupabase", name: str, params: dict):
+        self.db = db
+        self.name = name
+        self.params = params
+
+    def execute(self):
+        self.db.calls.append(("rpc", self.name))
+        return FakeResponse(self.db.functions[self.name](**self.params))
+
+
+class FakeSupabase:
+    def __init__(self):
+        self.tables = {}
+        self.functions = {}
+        self.calls = []
+        self.selects = []
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+    def rpc(self, name, params):
+        return FakeRPC(self, name, params)
+
+
+@pytest.fixture
+def fake_supabase():
+    return FakeSupabase()
@@ -0,0 +1,195 @@
+from email.mime.multipart import MIMEMultipart
+
+import pytest
+
+from app.services import email_service as es
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = es.SentEmailRegistry()
+    monkeypatch.setattr(es, "sent_emails", registry)
+    return registry
+
+
+@pytest.fixture
+def delivered(monkeypatch):
+    messages = []
+    monkeypatch.setattr(es, "_deliver", messages.append)
+    return messages
+
+
+def test_build_message_without_html_is_plain_text():
+    msg = es.EmailService._build_message("ana@test.com", "Hello", "Plain body")
+
+    assert not msg.is_multipart()
+    assert msg.get_content_type() == "text/plain"
+    assert msg["To"] == "ana@test.com"
+    assert msg["Subject"] == "Hello"
+    assert msg.get_payload(decode=True).decode() == "Plain body"
+
+
+def test_build_message_with_html_is_multipart_alternative():
+    msg = es.EmailService._build_message("ana@test.com", "Hello", "Plain body", "<p>HTML body</p>")
+
+    assert isinstance(msg, MIMEMultipart)
+    assert msg.get_content_type() == "multipart/alternative"
+    assert [part.get_content_type() for part in msg.get_payload()] == ["text/plain", "text/html"]
+
+
+def test_mail_worker_stop_delivers_queued_mail_first(registry, delivered):
+    worker = es.MailWorker()
+    for i in range(3):
+        worker.submit((f"user{i}@test.com", "Subject", "Body", None, f"key-{i}"))
+    worker.submit(("late@test.com", "Briefing", "Body", None, "key-late"), es.PRIORITY_BRIEFING)
+
+    worker.start()
+    worker.stop(timeout=5)
+
+    assert not worker.is_alive()
+    assert [msg["To"] for msg in delivered] == [
+        "user0@test.com", "user1@test.com", "user2@test.com", "late@test.com",
+    ]
+
+
+def test_stop_mail_worker_without_worker_is_a_no_op(monkeypatch):
+    monkeypatch.setattr(es, "_worker", None)
+
+    es.stop_mail_worker()
+
+    assert es._worker is None
+
+
+def test_send_email_sync_delivers_on_calling_thread(registry, delivered):
+    assert es.EmailService.send_email("ana@test.com", "Sync", "Body", sync=True)
+
+    assert [msg["To"] for msg in delivered] == ["ana@test.com"]
+    assert es._worker is None or es._worker.q.empty()
+
+
+def test_send_email_sync_reports_failure_and_allows_retry(registry, monkeypatch):
+    def fail(msg):
+        raise es.smtplib.SMTPServerDisconnected("gone")
+
+    monkeypatch.setattr(es, "_deliver", fail)
+    assert not es.EmailService.send_email("ana@test.com", "Sync", "Body", sync=True)
+
+    delivered = []
+    monkeypatch.setattr(es, "_deliver", delivered.append)
+    assert es.EmailService.send_email("ana@test.com", "Sync", "Body", sync=True)
+    assert len(delivered) == 1
+
+
+class FakeSMTP:
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    def send_message(self, msg):
+        self.sent.append(msg)
+
+    def noop(self):
+        return (250, b"OK")
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def opened(monkeypatch):
+    servers = []
+
+    def open_smtp():
+        servers.append(FakeSMTP())
+        return servers[-1]
+
+    monkeypatch.setattr(es, "_open_smtp", open_smtp)
+    return servers
+
+
+def test_pool_reuses_idle_connection(opened):
+    pool = es.SmtpConnectionPool(size=2)
+
+    with pool.acquire() as first:
+        pass
+    with pool.acquire() as second:
+        pass
+
+    assert first is second
+    assert len(opened) == 1
+
+
+def test_pool_discards_connection_after_transient_error(opened):
+    pool = es.SmtpConnectionPool(size=2)
+
+    with pytest.raises(es.smtplib.SMTPServerDisconnected):
+        with pool.acquire():
+            raise es.smtplib.SMTPServerDisconnected("gone")
+
+    with pool.acquire() as server:
+        pass
+
+    assert opened[0].closed
+    assert server is opened[1]
+
+
+def test_pool_keeps_connection_after_non_transient_error(opened):
+    pool = es.SmtpConnectionPool(size=2)
+
+    with pytest.raises(es.smtplib.SMTPRecipientsRefused):
+        with pool.acquire():
+            raise es.smtplib.SMTPRecipientsRefused({})
+
+    with pool.acquire() as server:
+        pass
+
+    assert server is opened[0]
+    assert not opened[0].closed
+
+
+def test_pool_retires_connection_after_message_limit(opened, monkeypatch):
+    monkeypatch.setattr(es.SmtpConnectionPool, "MAX_MESSAGES_PER_CONNECTION", 2)
+    pool = es.SmtpConnectionPool(size=2)
+
+    for _ in range(3):
+        with pool.acquire():
+            pass
+
+    assert opened[0].closed
+    assert len(opened) == 2
+
+
+def test_registry_claims_each_key_once_until_released(registry):
+    key = es.SentEmailRegistry.key_for("ana@test.com", "Hello", "Body")
+
+    assert registry.claim(key)
+    assert not registry.claim(key)
+
+    registry.release(key)
+    assert registry.claim(key)
+
+
+def test_send_email_drops_duplicate_within_window(registry, delivered):
+    assert es.EmailService.send_email("ana@test.com", "Hello", "Body", sync=True)
+    assert es.EmailService.send_email("ana@test.com", "Hello", "Body", sync=True)
+
+    assert len(delivered) == 1
+
+
+def test_mail_worker_releases_key_when_delivery_fails(registry, monkeypatch):
+    def fail(msg):
+        raise es.smtplib.SMTPServerDisconnected("gone")
+
+    monkeypatch.setattr(es, "_deliver", fail)
+    key = es.SentEmailRegistry.key_for("ana@test.com", "Hello", "Body")
+    registry.claim(key)
+
+    worker = es.MailWorker()
+    worker.submit(("ana@test.com", "Hello", "Body", None, key))
+    worker.start()
+    worker.stop(timeout=5)
+
+    assert registry.claim(key)
@@ -0,0 +1,231 @@
+from datetime import date, timedelta
+
+import pytest
+
+from app.services import health_summary_service as hs
+
+
+def keyset_page(rows, p_limit, p_after_user_id=None, p_after_type=None):
+    """Rows after the (user_id, biomarker_type) key, as the stats functions page them"""
+    after = (p_after_user_id, p_after_type)
+    rows = sorted(rows, key=lambda row: (row["user_id"], row["biomarker_type"]))
+    return [row for row in rows if p_after_user_id is None or (row["user_id"], row["biomarker_type"]) > after][:p_limit]
+
+
+@pytest.mark.asyncio
+async def test_fetch_day_stats_pages_through_rpc(fake_supabase, monkeypatch):
+    stats = [
+        {"user_id": f"user-{i // 2:05d}", "biomarker_type": t, "readings_count": 1, "total": 1.0}
+        for i, t in zip(range(hs.PAGE_SIZE * 2 + 2), ["heart_rate", "steps"] * (hs.PAGE_SIZE + 1))
+    ]
+
+    def daily_biomarker_summary(p_day, p_user_id, p_limit, **keyset):
+        return keyset_page(stats, p_limit, **keyset)
+
+    fake_supabase.functions["daily_biomarker_summary"] = daily_biomarker_summary
+    monkeypatch.setattr(hs, "supabase_admin", fake_supabase)
+
+    stats_by_user = await hs.HealthSummaryService._fetch_day_stats(date(2026, 10, 14))
+
+    assert len(stats_by_user) == hs.PAGE_SIZE + 1
+    assert sum(len(rows) for rows in stats_by_user.values()) == len(stats)
+    assert fake_supabase.calls.count(("rpc", "daily_biomarker_summary")) == 3
+
+
+@pytest.mark.asyncio
+async def test_fetch_previous_averages_picks_column_per_biomarker(fake_supabase, monkeypatch):
+    def previous_biomarker_averages(p_day, p_days, p_user_id, p_limit, **keyset):
+        rows = [
+            {"user_id": "user-1", "biomarker_type": "heart_rate", "avg_daily_mean": 70.0, "avg_daily_total": 210.0},
+            {"user_id": "user-1", "biomarker_type": "steps", "avg_daily_mean": 2500.0, "avg_daily_total": 8000.0},
+        ]
+        return keyset_page(rows, p_limit, **keyset)
+
+    fake_supabase.functions["previous_biomarker_averages"] = previous_biomarker_averages
+    monkeypatch.setattr(hs, "supabase_admin", fake_supabase)
+
+    averages = await hs.HealthSummaryService._fetch_previous_averages(date(2026, 10, 14))
+
+    assert averages == {"user-1": {"heart_rate": 70.0, "steps": 8000.0}}
+
+
+HEART_RATE_RANGE = {
+    "has_range": True,
+    "critical_low": 40.0, "critical_high": 150.0,
+    "min_optimal": 60.0, "max_optimal": 80.0,
+    "min_normal": 50.0, "max_normal": 100.0,
+}
+
+
+@pytest.mark.parametrize("value, expected", [
+    (70.0, "optimal"),
+    (90.0, "normal"),
+    (55.0, "normal"),
+    (120.0, "elevated"),
+    (45.0, "low"),
+    (40.0, "critical"),
+    (150.0, "critical"),
+])
+def test_classify_value_against_range(value, expected):
+    assert hs._classify_value(value, HEART_RATE_RANGE) == expected
+
+
+def test_classify_value_without_range_is_normal():
+    assert hs._classify_value(500.0, None) == "normal"
+
+
+def test_classify_value_treats_missing_bounds_as_open():
+    ranges = {"min_optimal": 7.0, "max_optimal": None, "min_normal": 6.0, "max_normal": None}
+
+    assert hs._classify_value(20.0, ranges) == "optimal"
+    assert hs._classify_value(6.5, ranges) == "normal"
+    assert hs._classify_value(5.0, ranges) == "low"
+
+
+@pytest.mark.parametrize("value, previous, expected", [
+    (70.0, None, None),
+    (103.0, 100.0, "stable"),
+    (90.0, 100.0, "improving"),
+    (110.0, 100.0, "declining"),
+    (75.0, 65.0, "improving"),
+])
+def test_calculate_trend(value, previous, expected):
+    assert hs._calculate_trend(value, previous, HEART_RATE_RANGE) == expected
+
+
+def test_calculate_trend_without_optimal_band_is_stable():
+    assert hs._calculate_trend(200.0, 100.0, None) == "stable"
+
+
+@pytest.mark.asyncio
+async def test_calculate_daily_summary_builds_metrics():
+    stats = [
+        {
+            "biomarker_type": "heart_rate", "readings_count": 3, "total": 210.0,
+            "min_value": 65.0, "max_value": 75.0, **HEART_RATE_RANGE,
+        },
+        {"biomarker_type": "steps", "readings_count": 1, "total": 12000.0, "has_range": False},
+    ]
+
+    result = await hs.HealthSummaryService.calculate_daily_summary(
+        "user-1", date(2026, 10, 14), "evening_summary",
+        preloaded_stats=stats, preloaded_previous={"heart_rate": 90.0}
+    )
+
+    metrics = result["summary_data"]["metrics"]
+    assert metrics["heart_rate"] == {
+        "avg": 70.0, "min": 65.0, "max": 75.0, "readings_count": 3,
+        "status": "optimal", "trend": "improving",
+    }
+    assert metrics["steps"]["total"] == 12000
+    assert metrics["steps"]["percentage"] == 120.0
+    assert metrics["steps"]["trend"] is None
+    assert result["total_readings"] == 4
+    assert result["biomarkers_tracked"] == ["heart_rate", "steps"]
+    assert result["overall_status"] == "good"
+    assert not result["has_critical_values"]
+    assert result["summary_data"]["daily_achievements"] == [
+        "Kept your heart rate in the optimal range",
+        "Reached your steps goal",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_calculate_daily_summary_flags_critical_values():
+    stats = [{
+        "biomarker_type": "heart_rate", "readings_count": 1, "total": 160.0,
+        "min_value": 160.0, "max_value": 160.0, **HEART_RATE_RANGE,
+    }]
+
+    result = await hs.HealthSummaryService.calculate_daily_summary(
+        "user-1", date(2026, 10, 14), "morning_briefing",
+        preloaded_stats=stats, preloaded_previous={}
+    )
+
+    assert result["overall_status"] == "critical"
+    assert result["has_critical_values"]
+    assert result["summary_data"]["alerts"]
+    assert result["summary_data"]["daily_achievements"] == []
+
+
+@pytest.mark.asyncio
+async def test_calculate_daily_summary_fetches_stats_when_not_preloaded(fake_supabase, monkeypatch):
+    def daily_biomarker_summary(p_day, p_user_id, p_limit, **keyset):
+        assert p_user_id == "user-1"
+        return keyset_page([{
+            "user_id": "user-1", "biomarker_type": "glucose", "readings_count": 2, "total": 180.0,
+            "min_value": 85.0, "max_value": 95.0, "has_range": False,
+        }], p_limit, **keyset)
+
+    def previous_biomarker_averages(p_day, p_days, p_user_id, p_limit, **keyset):
+        return []
+
+    fake_supabase.functions["daily_biomarker_summary"] = daily_biomarker_summary
+    fake_supabase.functions["previous_biomarker_averages"] = previous_biomarker_averages
+    monkeypatch.setattr(hs, "supabase_admin", fake_supabase)
+
+    result = await hs.HealthSummaryService.calculate_daily_summary("user-1", date(2026, 10, 14), "morning_briefing")
+
+    assert result["summary_data"]["metrics"]["glucose"]["avg"] == 90.0
+    assert result["summary_data"]["metrics"]["glucose"]["status"] == "normal"
+
+
+@pytest.mark.asyncio
+async def test_calculate_daily_summary_without_readings_returns_none():
+    result = await hs.HealthSummaryService.calculate_daily_summary(
+        "user-1", date(2026, 10, 14), "morning_briefing", preloaded_stats=[]
+    )
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_iter_user_summaries_range_yields_every_page(fake_supabase, monkeypatch):
+    start = date(2026, 1, 1)
+    days = hs.SUMMARY_RANGE_PAGE_SIZE + 50
+    fake_supabase.tables["daily_health_summaries"] = [
+        {"user_id": "user-1", "summary_date": (start + timedelta(days=i)).isoformat(), "summary_type": summary_type}
+        for i in range(days)
+        for summary_type in ("evening_summary", "morning_briefing")
+    ]
+    monkeypatch.setattr(hs, "supabase_admin", fake_supabase)
+
+    rows = [
+        row async for row in hs.HealthSummaryService.iter_user_summaries_range(
+            "user-1", start, start + timedelta(days=days)
+        )
+    ]
+
+    assert len(rows) == days * 2
+    assert rows[0]["summary_date"] == (start + timedelta(days=days - 1)).isoformat()
+    assert len({(row["summary_date"], row["summary_type"]) for row in rows}) == days * 2
+
+
+@pytest.mark.asyncio
+async def test_send_morning_briefing_emails_reads_names_from_patients(fake_supabase, monkeypatch):
+    fake_supabase.tables.update({
+        "daily_health_summaries": [
+            {"id": "s1", "user_id": "user-1", "summary_type": "morning_briefing", "email_sent": False, "summary_data": {}},
+            {"id": "s2", "user_id": "user-2", "summary_type": "morning_briefing", "email_sent": False, "summary_data": {}},
+        ],
+        "users": [
+            {"id": "user-1", "email": "ana@test.com", "username": "ana"},
+            {"id": "user-2", "email": "bo@test.com", "username": "bo"},
+        ],
+        "patients": [{"user_id": "user-1", "full_name": "Ana Silva"}],
+    })
+    sent = []
+
+    def send_morning_briefings(briefings):
+        sent.extend(briefings)
+        return [True] * len(briefings)
+
+    monkeypatch.setattr(hs, "supabase_admin", fake_supabase)
+    monkeypatch.setattr(hs.email_service, "send_morning_briefings", send_morning_briefings)
+
+    assert await hs.HealthSummaryService.send_morning_briefing_emails() == 2
+
+    assert ("users", "id, email, username") in fake_supabase.selects
+    assert ("patients", "user_id, full_name") in fake_supabase.selects
+    assert sorted((email, name) for email, name, _ in sent) == [("ana@test.com", "Ana Silva"), ("bo@test.com", "bo")]
+    assert all(row["email_sent"] for row in fake_supabase.tables["daily_health_summaries"])
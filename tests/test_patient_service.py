@@ -0,0 +1,26 @@
+from app.services import patient_service as ps
+
+
+def test_create_pending_goals_skips_rows_created_concurrently(fake_supabase, monkeypatch):
+    patients = [{"user_id": "user-1", "health_goals": [{"goal": "Walk", "frequency": "daily"}, {"goal": "Read"}]}]
+    completed = {
+        "user_id": "user-1", "goal_text": "Walk", "goal_frequency": "daily",
+        "completion_date": "2026-10-15", "status": "completed",
+    }
+
+    # Simulate a completion landing between the existing-rows read and the write
+    select_all = ps.select_all
+
+    def select_then_race(build_query):
+        rows = select_all(build_query)
+        fake_supabase.tables["goal_completions"].append(dict(completed))
+        return rows
+
+    monkeypatch.setattr(ps, "supabase_admin", fake_supabase)
+    monkeypatch.setattr(ps, "select_all", select_then_race)
+
+    created = ps.PatientService._create_pending_goals(patients, "2026-10-15")
+
+    assert [row["goal_text"] for row in created] == ["Read"]
+    statuses = {row["goal_text"]: row["status"] for row in fake_supabase.tables["goal_completions"]}
+    assert statuses == {"Walk": "completed", "Read": "pending"}
@@ -0,0 +1,29 @@
+from app.utils import queries
+
+
+def test_select_all_reads_past_first_page(fake_supabase):
+    total = queries.PAGE_SIZE * 2 + 5
+    fake_supabase.tables["daily_health_summaries"] = [{"id": f"{i:05d}"} for i in range(total)]
+
+    rows = queries.select_all(lambda: fake_supabase.table("daily_health_summaries").select("id").order("id"))
+
+    assert [row["id"] for row in rows] == [f"{i:05d}" for i in range(total)]
+
+
+def test_in_filter_batches_drops_duplicates_and_bounds_batches():
+    values = [f"id-{i}" for i in range(queries.IN_FILTER_BATCH_SIZE + 10)] + ["id-0"]
+
+    batches = list(queries.in_filter_batches(values))
+
+    assert [len(batch) for batch in batches] == [queries.IN_FILTER_BATCH_SIZE, 10]
+    assert sum(batches, []) == list(dict.fromkeys(values))
+
+
+def test_select_in_queries_every_batch(fake_supabase):
+    fake_supabase.tables["users"] = [{"id": f"id-{i}", "email": f"{i}@test.com"} for i in range(450)]
+    ids = [f"id-{i}" for i in range(0, 450, 2)] + ["missing"]
+
+    rows = queries.select_in(lambda: fake_supabase.table("users").select("id, email"), "id", ids)
+
+    assert sorted(row["id"] for row in rows) == sorted(ids[:-1])
+    assert fake_supabase.calls.count(("users", "select")) == 2